@@ -2,9 +2,11 @@ from __future__ import annotations
 import datetime as dt
 from typing import Tuple
 
+_DEGREE_SIGN_TRANS = str.maketrans({"°": "*"})
+
 
 def clamp(x: float, lo: float, hi: float) -> float:
-    return lo if x < lo else hi if x > hi else x
+    return max(lo, min(hi, x))
 
 
 def wrap_deg(deg: float) -> float:
@@ -66,7 +68,7 @@ def parse_lx200_signed_deg(s: str) -> float:
         s = s[1:]
     elif s.startswith("+"):
         s = s[1:]
-    s = s.replace("°", "*")
+    s = s.translate(_DEGREE_SIGN_TRANS)
     d_str, m_str = s.split("*", 1)
     d = int(d_str)
     m = int(m_str)
@@ -2,7 +2,7 @@ from __future__ import annotations
 import logging
 import threading
 import time
-from typing import Optional
+from typing import Optional, Sequence
 
 try:
     import serial
@@ -14,6 +14,7 @@ class SerialLineDevice:
     def __init__(self, port: str, baud: int, timeout_s: float, name: str):
         self.log = logging.getLogger(name)
         self.lock = threading.Lock()
+        self._input_dirty = True
         if serial is None:
             self.log.error("pyserial not available: install with 'pip install pyserial'")
             raise ImportError("pyserial is required for SerialLineDevice")
@@ -25,6 +26,11 @@ class SerialLineDevice:
             self.log.exception("Failed to open serial port %s", port)
             raise
 
+    def set_timeout(self, timeout_s: float) -> None:
+        with self.lock:
+            self.log.info("Serial read timeout set to %.3fs", timeout_s)
+            self.ser.timeout = timeout_s
+
     def close(self) -> None:
         with self.lock:
             try:
@@ -34,22 +40,49 @@ class SerialLineDevice:
 
     def transact(self, payload: bytes, terminator: bytes) -> bytes:
         """Write payload, then read until terminator (inclusive)."""
+        return self._exchange(payload, 1, terminator)[0]
+
+    def transact_many(self, payloads: Sequence[bytes], terminator: bytes) -> list[bytes]:
+        """Write all payloads in one go, then read one terminated reply per payload."""
+        return self._exchange(b"".join(payloads), len(payloads), terminator)
+
+    def _exchange(self, payload: bytes, count: int, terminator: bytes) -> list[bytes]:
         with self.lock:
-            self.log.debug("TX %r", payload)
-            self.ser.reset_input_buffer()
+            debug = self.log.isEnabledFor(logging.DEBUG)
+            if debug:
+                self.log.debug("TX %r", payload)
+            if self._input_dirty:
+                self.ser.reset_input_buffer()
+            self._input_dirty = True
             self.ser.write(payload)
-            self.ser.flush()
 
+            replies: list[bytes] = []
             buf = bytearray()
-            deadline = time.time() + (self.ser.timeout or 1.0)
+            term_len = len(terminator)
+            start = 0
+            scan_from = 0
+            deadline = time.monotonic() + (self.ser.timeout or 1.0)
             while True:
-                b = self.ser.read(1)
-                if b:
-                    buf += b
-                    if buf.endswith(terminator):
-                        self.log.debug("RX %r", bytes(buf))
-                        return bytes(buf)
-                else:
-                    if time.time() >= deadline:
-                        self.log.debug("RX TIMEOUT after %.3fs, got=%r", (self.ser.timeout or 0.0), bytes(buf))
-                        raise TimeoutError(f"serial timeout, got={bytes(buf)!r}")
+                chunk = self.ser.read(self.ser.in_waiting or 1)
+                if chunk:
+                    buf += chunk
+                    idx = buf.find(terminator, max(start, scan_from - term_len + 1))
+                    if idx >= 0:
+                        with memoryview(buf) as view:
+                            while idx >= 0:
+                                end = idx + term_len
+                                resp = bytes(view[start:end])
+                                if debug:
+                                    self.log.debug("RX %r", resp)
+                                replies.append(resp)
+                                start = end
+                                if len(replies) == count:
+                                    self._input_dirty = False
+                                    return replies
+                                idx = buf.find(terminator, start)
+                    scan_from = len(buf)
+                elif time.monotonic() >= deadline:
+                    got = bytes(buf)
+                    if debug:
+                        self.log.debug("RX TIMEOUT after %.3fs, got=%r", (self.ser.timeout or 0.0), got)
+                    raise TimeoutError(f"serial timeout, got={got!r}")
@@ -1,6 +1,7 @@
 from __future__ import annotations
 import dataclasses
 import logging
+import threading
 import time
 from enum import IntEnum, StrEnum
 from typing import Optional
@@ -101,6 +102,10 @@ class SkyWatcherRevu24Error(Exception):
     pass
 
 
+class SkyWatcherPollerError(Exception):
+    pass
+
+
 class SkyWatcherRevu24Constants:
     HEX_LENGTH = 6
     HEX_BASE = 16
@@ -250,16 +255,30 @@ class SkyWatcherMotionMode:
         return f"{mode}{direction}"
 
 
+@dataclasses.dataclass(frozen=True)
+class SkyWatcherStateSample:
+    monotonic_ns: int
+    status: SkyWatcherStatus
+    position: int
+
+
 class SkyWatcherMC:
     """SkyWatcher motor controller protocol wrapper."""
 
     _LEADING = b":"
     _TRAILING = b"\r"
+    _STATE_COMMANDS: tuple[tuple[SkyWatcherCommand, Optional[str]], ...] = (
+        (SkyWatcherCommand.INQUIRE_STATUS, None),
+        (SkyWatcherCommand.INQUIRE_POSITION, None),
+    )
 
     def __init__(self, dev: SerialLineDevice, logger: Optional[logging.Logger] = None) -> None:
         LOGGER.info("init dev=%r logger=%r", dev, logger)
         self.dev = dev
         self.log = logger or logging.getLogger("skywatcher.mc")
+        self._latest: dict[SkyWatcherAxis, SkyWatcherStateSample] = {}
+        self._state_cond = threading.Condition()
+        self._pollers: dict[SkyWatcherAxis, tuple[threading.Thread, threading.Event]] = {}
 
     def inquire_timer_freq(self, axis: SkyWatcherAxis = SkyWatcherAxis.RA) -> int:
         self.log.info("timer_freq axis=%s", axis)
@@ -284,6 +303,73 @@ class SkyWatcherMC:
         data = self._transact(SkyWatcherCommand.INQUIRE_STATUS, axis)
         return SkyWatcherStatus.from_bytes(data)
 
+    def inquire_state(self, axis: SkyWatcherAxis = SkyWatcherAxis.RA) -> tuple[SkyWatcherStatus, int]:
+        """Inquire status and position with both requests sent in a single write."""
+        status_data, position_data = self._transact_many(axis, self._STATE_COMMANDS)
+        return SkyWatcherStatus.from_bytes(status_data), SkyWatcherRevu24.from_bytes(position_data).value
+
+    def start_poller(self, axis: SkyWatcherAxis, interval_s: float) -> None:
+        """Keep sampling status and position of ``axis`` in a background thread."""
+        self.log.info("start_poller axis=%s interval_s=%s", axis, interval_s)
+        if axis in self._pollers:
+            raise SkyWatcherPollerError(f"poller already running for axis={axis}")
+        stop = threading.Event()
+        thread = threading.Thread(
+            target=self._poll_state,
+            args=(axis, interval_s, stop),
+            name=f"skywatcher-poller-{axis.name}",
+            daemon=True,
+        )
+        self._pollers[axis] = (thread, stop)
+        thread.start()
+
+    def stop_poller(self) -> None:
+        self.log.info("stop_poller axes=%s", list(self._pollers))
+        pollers = list(self._pollers.values())
+        self._pollers.clear()
+        for _, stop in pollers:
+            stop.set()
+        for thread, _ in pollers:
+            thread.join()
+
+    def latest(self, axis: SkyWatcherAxis) -> Optional[SkyWatcherStateSample]:
+        """Most recent poller sample for ``axis``, without touching the serial line."""
+        return self._latest.get(axis)
+
+    def wait_state(
+        self,
+        axis: SkyWatcherAxis,
+        *,
+        newer_than_ns: int,
+        timeout_s: float,
+    ) -> Optional[SkyWatcherStateSample]:
+        """Block until the poller posts a sample taken after ``newer_than_ns``; None on timeout."""
+        if axis not in self._pollers:
+            raise SkyWatcherPollerError(f"poller is not running for axis={axis}")
+
+        def fresh() -> Optional[SkyWatcherStateSample]:
+            sample = self._latest.get(axis)
+            if sample is None or sample.monotonic_ns <= newer_than_ns:
+                return None
+            return sample
+
+        with self._state_cond:
+            return self._state_cond.wait_for(fresh, timeout=timeout_s)
+
+    def _poll_state(self, axis: SkyWatcherAxis, interval_s: float, stop: threading.Event) -> None:
+        while not stop.is_set():
+            # Stamp before the request so a sample never looks newer than the state it reports.
+            sample_ns = time.monotonic_ns()
+            try:
+                status, pos = self.inquire_state(axis)
+            except Exception:
+                self.log.warning("poller inquire failed axis=%s", axis, exc_info=True)
+            else:
+                with self._state_cond:
+                    self._latest[axis] = SkyWatcherStateSample(sample_ns, status, pos)
+                    self._state_cond.notify_all()
+            stop.wait(interval_s)
+
     def inquire_highspeed_ratio(self, axis: SkyWatcherAxis = SkyWatcherAxis.RA) -> int:
         self.log.info("highspeed_ratio axis=%s", axis)
         data = self._transact(SkyWatcherCommand.INQUIRE_HIGHSPEED_RATIO, axis)
@@ -330,6 +416,35 @@ class SkyWatcherMC:
         self.log.info("emergency_stop axis=%s", axis)
         self._transact(SkyWatcherCommand.INSTANT_STOP, axis)
 
+    def configure_and_start_goto(
+        self,
+        axis: SkyWatcherAxis,
+        mode: SkyWatcherMotionMode,
+        increment: int,
+        *,
+        step_period: int,
+        break_increment: int,
+    ) -> None:
+        """Set up a relative goto in a single write, then start it once every setup frame is ACKed."""
+        self.log.info(
+            "configure_and_start_goto axis=%s mode=%s increment=%s step_period=%s break_increment=%s",
+            axis,
+            mode,
+            increment,
+            step_period,
+            break_increment,
+        )
+        self._transact_many(
+            axis,
+            (
+                (SkyWatcherCommand.SET_MOTION_MODE, mode.to_command()),
+                (SkyWatcherCommand.SET_STEP_PERIOD, SkyWatcherRevu24.from_int(step_period).to_ascii()),
+                (SkyWatcherCommand.SET_BREAK_POINT_INCREMENT, SkyWatcherRevu24.from_int(break_increment).to_ascii()),
+                (SkyWatcherCommand.SET_GOTO_TARGET_INCREMENT, SkyWatcherRevu24.from_int(increment).to_ascii()),
+            ),
+        )
+        self._transact(SkyWatcherCommand.START_MOTION, axis)
+
     def set_ra_rate(self, rate: float, axis: SkyWatcherAxis = SkyWatcherAxis.RA) -> None:
         abs_rate = abs(rate)
         if abs_rate < SkyWatcherConstants.MIN_RATE or abs_rate > SkyWatcherConstants.MAX_RATE:
@@ -407,28 +522,50 @@ class SkyWatcherMC:
         arg: Optional[str] = None,
     ) -> bytes:
         # self.log.info("command cmd=%s axis=%s arg=%r", cmd, axis, arg)
+        payload = self._encode(cmd, axis, arg)
+        debug = self.log.isEnabledFor(logging.DEBUG)
+        if debug:
+            self.log.debug(
+                "tx cmd=%s axis=%s arg=%r raw=%r hex=%s",
+                cmd,
+                axis,
+                arg,
+                payload,
+                payload.hex(),
+            )
+        resp = self.dev.transact(payload, terminator=self._TRAILING)
+        if debug:
+            self.log.debug(
+                "rx cmd=%s axis=%s arg=%r raw=%r hex=%s",
+                cmd,
+                axis,
+                arg,
+                resp,
+                resp.hex(),
+            )
+        return self._decode(cmd, axis, resp)
+
+    def _transact_many(
+        self,
+        axis: SkyWatcherAxis,
+        cmds: tuple[tuple[SkyWatcherCommand, Optional[str]], ...],
+    ) -> list[bytes]:
+        payloads = [self._encode(cmd, axis, arg) for cmd, arg in cmds]
+        debug = self.log.isEnabledFor(logging.DEBUG)
+        if debug:
+            self.log.debug("tx cmds=%s axis=%s raw=%r", cmds, axis, payloads)
+        resps = self.dev.transact_many(payloads, terminator=self._TRAILING)
+        if debug:
+            self.log.debug("rx cmds=%s axis=%s raw=%r", cmds, axis, resps)
+        return [self._decode(cmd, axis, resp) for (cmd, _), resp in zip(cmds, resps)]
+
+    def _encode(self, cmd: SkyWatcherCommand, axis: SkyWatcherAxis, arg: Optional[str] = None) -> bytes:
         axis_char = self._normalize_axis(axis)
         if arg is None:
-            payload = self._LEADING + cmd.encode("ascii") + axis_char + self._TRAILING
-        else:
-            payload = self._LEADING + cmd.encode("ascii") + axis_char + arg.encode("ascii") + self._TRAILING
-        self.log.debug(
-            "tx cmd=%s axis=%s arg=%r raw=%r hex=%s",
-            cmd,
-            axis,
-            arg,
-            payload,
-            payload.hex(),
-        )
-        resp = self.dev.transact(payload, terminator=self._TRAILING)
-        self.log.debug(
-            "rx cmd=%s axis=%s arg=%r raw=%r hex=%s",
-            cmd,
-            axis,
-            arg,
-            resp,
-            resp.hex(),
-        )
+            return self._LEADING + cmd.encode("ascii") + axis_char + self._TRAILING
+        return self._LEADING + cmd.encode("ascii") + axis_char + arg.encode("ascii") + self._TRAILING
+
+    def _decode(self, cmd: SkyWatcherCommand, axis: SkyWatcherAxis, resp: bytes) -> bytes:
         if not resp:
             raise RuntimeError(f"empty response for cmd={cmd} axis={axis}")
         if resp.endswith(self._TRAILING):
@@ -1,9 +1,9 @@
 from __future__ import annotations
 
+import asyncio
 import dataclasses
 import datetime as dt
 import logging
-import socket
 import threading
 import time
 from enum import StrEnum
@@ -37,14 +37,13 @@ LOGGER = logging.getLogger("lx200.dummy")
 class LX200DummyConstants:
     HOST = "127.0.0.1"
     PORT = 7624
-    BACKLOG = 1
+    BACKLOG = 128
     BUFFER_SIZE = 1024
-    ENCODING = "ascii"
-    DECODE_ERRORS = "ignore"
-    TERMINATOR_BYTE = LX200Constants.TERMINATOR.encode(ENCODING)
+    ENCODING = LX200Constants.ENCODING
+    TERMINATOR_BYTE = LX200Constants.TERMINATOR_BYTES
     ALIGNMENT_QUERY_BYTE = b"\x06"
-    EMPTY_RESPONSE = ""
-    RESPONSE_ERROR = LX200Constants.RESPONSE_ERR
+    EMPTY_RESPONSE_BYTES = LX200Constants.RESPONSE_EMPTY.encode(ENCODING)
+    RESPONSE_ERROR_BYTES = LX200Constants.RESPONSE_ERR.encode(ENCODING)
     MIN_RA = LX200Constants.MIN_HOUR
     MAX_RA = LX200Constants.HOURS_PER_DAY
     MIN_DEC = LX200Constants.MIN_LAT_DEG
@@ -65,7 +64,8 @@ class LX200DummyConstants:
     HOURS_PER_DAY = 24
     SECONDS_PER_HOUR = SECONDS_PER_MINUTE * MINUTES_PER_HOUR
     SECONDS_PER_DAY = SECONDS_PER_HOUR * HOURS_PER_DAY
-    SOCKET_TRUE = 1
+    NO_MOTION = 0
+    MOVE_BITS = {direction: 1 << bit for bit, direction in enumerate(LX200MoveDirection)}
 
 
 class LX200DummyServerError(Exception):
@@ -78,7 +78,10 @@ class LX200AlignmentMode(StrEnum):
     POLAR = "P"
 
 
-@dataclasses.dataclass
+_ALIGNMENT_RESPONSES = {mode: mode.value.encode(LX200DummyConstants.ENCODING) for mode in LX200AlignmentMode}
+
+
+@dataclasses.dataclass(slots=True)
 class LX200DummyState:
     current_ra: float = LX200DummyConstants.DEFAULT_RA
     current_dec: float = LX200DummyConstants.DEFAULT_DEC
@@ -91,7 +94,7 @@ class LX200DummyState:
     local_time: dt.time = LX200DummyConstants.DEFAULT_LOCAL_TIME
     local_date: dt.date = LX200DummyConstants.DEFAULT_LOCAL_DATE
     alignment_mode: LX200AlignmentMode = LX200AlignmentMode.POLAR
-    moving: dict[LX200MoveDirection, bool] = dataclasses.field(default_factory=dict)
+    moving_mask: int = LX200DummyConstants.NO_MOTION
     last_update_monotonic: float = dataclasses.field(default_factory=time.monotonic)
 
     def __post_init__(self) -> None:
@@ -101,8 +104,6 @@ class LX200DummyState:
         self.target_dec = clamp(self.target_dec, LX200DummyConstants.MIN_DEC, LX200DummyConstants.MAX_DEC)
         self.latitude_deg = clamp(self.latitude_deg, LX200DummyConstants.MIN_DEC, LX200DummyConstants.MAX_DEC)
         self.longitude_west_deg = clamp(self.longitude_west_deg, LX200DummyConstants.MIN_LON, LX200DummyConstants.MAX_LON)
-        for direction in LX200MoveDirection:
-            self.moving.setdefault(direction, False)
 
     def update_time(self) -> None:
         now = time.monotonic()
@@ -128,11 +129,14 @@ class LX200DummyServer:
     def __init__(self, state: Optional[LX200DummyState] = None, logger: Optional[logging.Logger] = None) -> None:
         self.state = state or LX200DummyState()
         self.lock = threading.Lock()
+        # Kept so state writes made outside the command path can drop their cached answers.
+        self._time = LX200TimePlugin(self)
+        self._site = LX200SitePlugin(self)
         self.server = LX200Server(
             [
                 LX200PointingPlugin(self),
-                LX200TimePlugin(self),
-                LX200SitePlugin(self),
+                self._time,
+                self._site,
                 LX200TrackingPlugin(self),
                 LX200ObjectPlugin(self),
             ],
@@ -140,64 +144,62 @@ class LX200DummyServer:
         )
 
     def handle_command(self, raw: str) -> str:
+        self._update_time()
         return self.server.handle_command(raw)
 
+    def handle_command_bytes(self, raw: bytes) -> bytes:
+        self._update_time()
+        return self.server.handle_command_bytes(raw)
+
     def _update_time(self) -> None:
         with self.lock:
             self.state.update_time()
 
     def get_current_ra(self) -> LX200Ra:
-        self._update_time()
         with self.lock:
-            return LX200Ra(self.state.current_ra)
+            return LX200Ra.interned(self.state.current_ra)
 
     def get_current_dec(self) -> LX200Dec:
-        self._update_time()
         with self.lock:
-            return LX200Dec(self.state.current_dec)
+            return LX200Dec.interned(self.state.current_dec)
 
-    def set_target_ra(self, ra: LX200Ra) -> bool:
+    def update_pointing(self, ra: Optional[LX200Ra] = None, dec: Optional[LX200Dec] = None) -> bool:
         with self.lock:
-            self.state.target_ra = wrap_hours(ra.hours)
+            if ra is not None:
+                self.state.target_ra = ra.hours
+            if dec is not None:
+                self.state.target_dec = dec.degrees
         return True
 
+    def set_target_ra(self, ra: LX200Ra) -> bool:
+        return self.update_pointing(ra=ra)
+
     def set_target_dec(self, dec: LX200Dec) -> bool:
-        with self.lock:
-            self.state.target_dec = clamp(dec.degrees, LX200DummyConstants.MIN_DEC, LX200DummyConstants.MAX_DEC)
-        return True
+        return self.update_pointing(dec=dec)
 
     def slew_to_target(self) -> LX200GotoResult:
         with self.lock:
-            self.state.current_ra = wrap_hours(self.state.target_ra)
-            self.state.current_dec = clamp(
-                self.state.target_dec,
-                LX200DummyConstants.MIN_DEC,
-                LX200DummyConstants.MAX_DEC,
-            )
+            self.state.current_ra = self.state.target_ra
+            self.state.current_dec = self.state.target_dec
         return LX200GotoResult.OK
 
     def sync_to_target(self) -> LX200SyncResult:
         with self.lock:
-            self.state.current_ra = wrap_hours(self.state.target_ra)
-            self.state.current_dec = clamp(
-                self.state.target_dec,
-                LX200DummyConstants.MIN_DEC,
-                LX200DummyConstants.MAX_DEC,
-            )
+            self.state.current_ra = self.state.target_ra
+            self.state.current_dec = self.state.target_dec
         return LX200SyncResult.OK
 
     def stop_all(self) -> None:
         with self.lock:
-            for direction in self.state.moving:
-                self.state.moving[direction] = False
+            self.state.moving_mask = LX200DummyConstants.NO_MOTION
 
     def start_move(self, direction: LX200MoveDirection) -> None:
         with self.lock:
-            self.state.moving[direction] = True
+            self.state.moving_mask |= LX200DummyConstants.MOVE_BITS[direction]
 
     def stop_move(self, direction: LX200MoveDirection) -> None:
         with self.lock:
-            self.state.moving[direction] = False
+            self.state.moving_mask &= ~LX200DummyConstants.MOVE_BITS[direction]
 
     def set_slew_rate(self, rate: LX200SlewRate) -> None:
         with self.lock:
@@ -216,29 +218,37 @@ class LX200DummyServer:
     def set_utc_offset(self, value: LX200UtcOffset) -> bool:
         with self.lock:
             self.state.utc_offset = value.hours
+        self._time.invalidate()
         return True
 
-    def set_latitude(self, latitude_deg: float) -> bool:
+    def update_site(
+        self,
+        latitude_deg: Optional[float] = None,
+        longitude_west_deg: Optional[float] = None,
+    ) -> bool:
         with self.lock:
-            self.state.latitude_deg = clamp(latitude_deg, LX200DummyConstants.MIN_DEC, LX200DummyConstants.MAX_DEC)
+            if latitude_deg is not None:
+                self.state.latitude_deg = clamp(latitude_deg, LX200DummyConstants.MIN_DEC, LX200DummyConstants.MAX_DEC)
+            if longitude_west_deg is not None:
+                self.state.longitude_west_deg = clamp(
+                    longitude_west_deg,
+                    LX200DummyConstants.MIN_LON,
+                    LX200DummyConstants.MAX_LON,
+                )
+        self._site.invalidate()
         return True
 
+    def set_latitude(self, latitude_deg: float) -> bool:
+        return self.update_site(latitude_deg=latitude_deg)
+
     def set_longitude(self, longitude_west_deg: float) -> bool:
-        with self.lock:
-            self.state.longitude_west_deg = clamp(
-                longitude_west_deg,
-                LX200DummyConstants.MIN_LON,
-                LX200DummyConstants.MAX_LON,
-            )
-        return True
+        return self.update_site(longitude_west_deg=longitude_west_deg)
 
     def get_local_time(self) -> LX200Time:
-        self._update_time()
         with self.lock:
             return LX200Time(hour=self.state.local_time.hour, minute=self.state.local_time.minute, second=self.state.local_time.second)
 
     def get_date(self) -> LX200Date:
-        self._update_time()
         with self.lock:
             return LX200Date(month=self.state.local_date.month, day=self.state.local_date.day, year=self.state.local_date.year)
 
@@ -280,26 +290,29 @@ class LX200DummyTcpServer:
         self.host = host
         self.port = port
         self.log = logger or logging.getLogger("lx200.tcp")
-        self._socket: Optional[socket.socket] = None
+        self._server: Optional[asyncio.Server] = None
 
     def serve_forever(self) -> None:
-        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as srv:
-            srv.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, LX200DummyConstants.SOCKET_TRUE)
-            srv.bind((self.host, self.port))
-            srv.listen(LX200DummyConstants.BACKLOG)
-            self._socket = srv
-            self.log.info("Dummy server listening on %s:%s", self.host, self.port)
-            while True:
-                conn, addr = srv.accept()
-                self.log.info("Client connected: %s", addr)
-                thread = threading.Thread(target=self._handle_client, args=(conn,), daemon=True)
-                thread.start()
-
-    def _handle_client(self, conn: socket.socket) -> None:
-        with conn:
-            buf = bytearray()
+        asyncio.run(self._serve())
+
+    async def _serve(self) -> None:
+        self._server = await asyncio.start_server(
+            self._handle_client,
+            self.host,
+            self.port,
+            backlog=LX200DummyConstants.BACKLOG,
+            reuse_address=True,
+        )
+        self.log.info("Dummy server listening on %s:%s", self.host, self.port)
+        async with self._server:
+            await self._server.serve_forever()
+
+    async def _handle_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self.log.info("Client connected: %s", writer.get_extra_info("peername"))
+        buf = bytearray()
+        try:
             while True:
-                data = conn.recv(LX200DummyConstants.BUFFER_SIZE)
+                data = await reader.read(LX200DummyConstants.BUFFER_SIZE)
                 if not data:
                     return
                 idx = data.find(LX200DummyConstants.ALIGNMENT_QUERY_BYTE)
@@ -310,7 +323,7 @@ class LX200DummyTcpServer:
                         response = self.handler_alignment_query()
                         self.log.debug("rx raw=%r cmd=<ACK>", LX200DummyConstants.ALIGNMENT_QUERY_BYTE)
                         self.log.debug("tx response=%r", response)
-                        conn.sendall(response.encode(LX200DummyConstants.ENCODING))
+                        writer.write(response)
                         data = data[idx + 1 :]
                         idx = data.find(LX200DummyConstants.ALIGNMENT_QUERY_BYTE)
                     if data:
@@ -323,41 +336,49 @@ class LX200DummyTcpServer:
                         break
                     raw = bytes(buf[: idx + 1])
                     del buf[: idx + 1]
-                    self._handle_raw(conn, raw)
-
-    def _handle_raw(self, conn: socket.socket, raw: bytes) -> None:
+                    self._handle_raw(writer, raw)
+                await writer.drain()
+        except ConnectionError:
+            self.log.info("Client connection lost: %s", writer.get_extra_info("peername"))
+        finally:
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+
+    def _handle_raw(self, writer: asyncio.StreamWriter, raw: bytes) -> None:
         try:
             if LX200DummyConstants.ALIGNMENT_QUERY_BYTE in raw:
                 response = self.handler_alignment_query()
                 self.log.debug("rx raw=%r cmd=<ACK>", raw)
                 self.log.debug("tx response=%r", response)
-                conn.sendall(response.encode(LX200DummyConstants.ENCODING))
+                writer.write(response)
                 return
-            text = raw.decode(LX200DummyConstants.ENCODING, errors=LX200DummyConstants.DECODE_ERRORS)
-            if LX200Constants.PREFIX not in text:
+            start = raw.find(LX200Constants.PREFIX_BYTES)
+            if start < 0:
                 return
-            start = text.index(LX200Constants.PREFIX)
-            command = text[start:]
+            command = raw[start:]
             self.log.debug("rx raw=%r cmd=%r", raw, command)
-            response = self.handler.handle_command(command)
+            response = self.handler.handle_command_bytes(command)
         except (LX200ParseError, LX200UnsupportedCommandError, LX200ValueError) as exc:
             self.log.debug("Parse error: %s", exc)
-            response = LX200DummyConstants.RESPONSE_ERROR
+            response = LX200DummyConstants.RESPONSE_ERROR_BYTES
         except Exception:
             self.log.exception("Handler error")
-            response = LX200DummyConstants.RESPONSE_ERROR
-        if response == LX200DummyConstants.EMPTY_RESPONSE:
+            response = LX200DummyConstants.RESPONSE_ERROR_BYTES
+        if response == LX200DummyConstants.EMPTY_RESPONSE_BYTES:
             self.log.debug("tx empty")
             return
         self.log.debug("tx response=%r", response)
         self.log.debug("")
-        conn.sendall(response.encode(LX200DummyConstants.ENCODING))
+        writer.write(response)
 
-    def handler_alignment_query(self) -> str:
+    def handler_alignment_query(self) -> bytes:
         if isinstance(self.handler, LX200DummyServer):
             with self.handler.lock:
-                return self.handler.state.alignment_mode.value
-        return LX200AlignmentMode.POLAR.value
+                return _ALIGNMENT_RESPONSES[self.handler.state.alignment_mode]
+        return _ALIGNMENT_RESPONSES[LX200AlignmentMode.POLAR]
 
 
 def run_dummy_server(
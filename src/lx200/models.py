@@ -2,12 +2,74 @@ from __future__ import annotations
 
 import dataclasses
 import datetime as dt
-from typing import Tuple
+import functools
+import re
+from typing import Optional, Tuple
 
 from .protocol import LX200Constants, LX200ValueError
 
-
-@dataclasses.dataclass(frozen=True)
+_RA_FORMAT = "%0{w}d{sep}%0{w}d{sep}%0{w}d{term}".format(
+    w=LX200Constants.TIME_FIELD_WIDTH,
+    sep=LX200Constants.TIME_SEP,
+    term=LX200Constants.TERMINATOR,
+)
+_DEC_FORMAT = "%s%0{dw}d{dms}%0{mw}d{sep}%0{sw}d{term}".format(
+    dw=LX200Constants.LAT_DEG_WIDTH,
+    dms=LX200Constants.DEG_MIN_SEP,
+    mw=LX200Constants.MIN_FIELD_WIDTH,
+    sep=LX200Constants.TIME_SEP,
+    sw=LX200Constants.TIME_FIELD_WIDTH,
+    term=LX200Constants.TERMINATOR,
+)
+_TIME_FORMAT = _RA_FORMAT
+_DATE_FORMAT = "%0{w}d{sep}%0{w}d{sep}%0{yw}d{term}".format(
+    w=LX200Constants.DATE_FIELD_WIDTH,
+    yw=LX200Constants.YEAR_FIELD_WIDTH,
+    sep=LX200Constants.DATE_SEP,
+    term=LX200Constants.TERMINATOR,
+)
+
+_DEC_PATTERN = re.compile(
+    r"\s*([{signs}]?)(\d+)[{deg_seps}](\d+)(?:{time_sep}(\d+))?\s*".format(
+        signs=re.escape(LX200Constants.SIGN_POS + LX200Constants.SIGN_NEG),
+        deg_seps=re.escape(LX200Constants.DEG_MIN_SEP + LX200Constants.DEGREE_SIGN),
+        time_sep=re.escape(LX200Constants.TIME_SEP),
+    )
+)
+
+
+def _deg_to_dms(deg: float) -> Tuple[int, int, int, int]:
+    sign = LX200Constants.SIGN_POS_INT
+    if deg < LX200Constants.MIN_SECOND:
+        sign = LX200Constants.SIGN_NEG_INT
+        deg = -deg
+    degrees = int(deg)
+    remainder = (deg - degrees) * LX200Constants.MIN_PER_DEG
+    minutes = int(remainder)
+    seconds = int(round((remainder - minutes) * LX200Constants.SECONDS_PER_MINUTE))
+    if seconds == LX200Constants.SECONDS_PER_MINUTE:
+        seconds = LX200Constants.MIN_SECOND
+        minutes += LX200Constants.SIGN_POS_INT
+    if minutes == LX200Constants.MIN_PER_DEG:
+        minutes = LX200Constants.MIN_MINUTE
+        degrees += LX200Constants.SIGN_POS_INT
+    return sign, degrees, minutes, seconds
+
+
+def _parse_fixed_triplet(value: str, sep: str, width: int) -> Optional[Tuple[int, int, int]]:
+    """Parse canonical fixed-width ``AA<sep>BB<sep>CC`` by offsets; None if not canonical."""
+    second_start = width + len(sep)
+    third_start = second_start + second_start
+    if (
+        len(value) != third_start + width
+        or value[width:second_start] != sep
+        or value[second_start + width : third_start] != sep
+    ):
+        return None
+    return int(value[:width]), int(value[second_start : second_start + width]), int(value[third_start:])
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
 class LX200Ra:
     hours: float
 
@@ -47,23 +109,25 @@ class LX200Ra:
 
     @classmethod
     def _parse_ra_hms(cls, value: str) -> float:
-        parts = value.strip().split(LX200Constants.TIME_SEP)
-        if len(parts) != LX200Constants.TIME_PARTS:
-            raise LX200ValueError(f"bad RA {value!r}")
-        hour, minute, second = (int(p) for p in parts)
+        value = value.strip()
+        fields = _parse_fixed_triplet(value, LX200Constants.TIME_SEP, LX200Constants.TIME_FIELD_WIDTH)
+        if fields is not None:
+            hour, minute, second = fields
+        else:
+            parts = value.split(LX200Constants.TIME_SEP)
+            if len(parts) != LX200Constants.TIME_PARTS:
+                raise LX200ValueError(f"bad RA {value!r}")
+            hour, minute, second = (int(p) for p in parts)
         return cls._wrap_hours(cls._hms_to_hours(hour, minute, second))
 
     @classmethod
     def _format_ra(cls, hours: float) -> str:
-        hour, minute, second = cls._hours_to_hms(hours)
-        return (
-            f"{hour:0{LX200Constants.TIME_FIELD_WIDTH}d}"
-            f"{LX200Constants.TIME_SEP}"
-            f"{minute:0{LX200Constants.TIME_FIELD_WIDTH}d}"
-            f"{LX200Constants.TIME_SEP}"
-            f"{second:0{LX200Constants.TIME_FIELD_WIDTH}d}"
-            f"{LX200Constants.TERMINATOR}"
-        )
+        return _RA_FORMAT % cls._hours_to_hms(hours)
+
+    @classmethod
+    @functools.lru_cache(maxsize=LX200Constants.MODEL_CACHE_SIZE)
+    def interned(cls, hours: float) -> "LX200Ra":
+        return cls(hours)
 
     @classmethod
     def from_string(cls, value: str) -> "LX200Ra":
@@ -73,7 +137,7 @@ class LX200Ra:
         return self._format_ra(self.hours)
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, slots=True)
 class LX200Dec:
     degrees: float
 
@@ -83,47 +147,18 @@ class LX200Dec:
 
     @staticmethod
     def _clamp(value: float, minimum: float, maximum: float) -> float:
-        return minimum if value < minimum else maximum if value > maximum else value
-
-    @staticmethod
-    def _deg_to_dms(deg: float) -> Tuple[int, int, int, int]:
-        sign = LX200Constants.SIGN_POS_INT
-        if deg < LX200Constants.MIN_SECOND:
-            sign = LX200Constants.SIGN_NEG_INT
-            deg = -deg
-        degrees = int(deg)
-        remainder = (deg - degrees) * LX200Constants.MIN_PER_DEG
-        minutes = int(remainder)
-        seconds = int(round((remainder - minutes) * LX200Constants.SECONDS_PER_MINUTE))
-        if seconds == LX200Constants.SECONDS_PER_MINUTE:
-            seconds = LX200Constants.MIN_SECOND
-            minutes += LX200Constants.SIGN_POS_INT
-        if minutes == LX200Constants.MIN_PER_DEG:
-            minutes = LX200Constants.MIN_MINUTE
-            degrees += LX200Constants.SIGN_POS_INT
-        return sign, degrees, minutes, seconds
+        return max(minimum, min(maximum, value))
 
     @classmethod
     def _parse_dec_dms(cls, value: str) -> float:
-        value = value.strip()
-        sign = LX200Constants.SIGN_POS_INT
-        if value.startswith(LX200Constants.SIGN_NEG):
-            sign = LX200Constants.SIGN_NEG_INT
-            value = value[1:]
-        elif value.startswith(LX200Constants.SIGN_POS):
-            value = value[1:]
-        value = value.replace(LX200Constants.DEGREE_SIGN, LX200Constants.DEG_MIN_SEP)
-        if LX200Constants.DEG_MIN_SEP not in value:
+        match = _DEC_PATTERN.fullmatch(value)
+        if match is None:
             raise LX200ValueError(f"bad DEC {value!r}")
-        deg_str, rest = value.split(LX200Constants.DEG_MIN_SEP, 1)
+        sign_str, deg_str, min_str, sec_str = match.groups()
+        sign = LX200Constants.SIGN_NEG_INT if sign_str == LX200Constants.SIGN_NEG else LX200Constants.SIGN_POS_INT
         degrees = int(deg_str)
-        if LX200Constants.TIME_SEP in rest:
-            min_str, sec_str = rest.split(LX200Constants.TIME_SEP, 1)
-            minutes = int(min_str)
-            seconds = int(sec_str)
-        else:
-            minutes = int(rest)
-            seconds = LX200Constants.DEFAULT_SECOND
+        minutes = int(min_str)
+        seconds = LX200Constants.DEFAULT_SECOND if sec_str is None else int(sec_str)
         deg_value = sign * (
             degrees
             + minutes / LX200Constants.MIN_PER_DEG
@@ -134,16 +169,14 @@ class LX200Dec:
     @classmethod
     def _format_dec(cls, degrees: float) -> str:
         degrees = cls._clamp(degrees, LX200Constants.MIN_LAT_DEG, LX200Constants.MAX_LAT_DEG)
-        sign, deg_value, minutes, seconds = cls._deg_to_dms(degrees)
+        sign, deg_value, minutes, seconds = _deg_to_dms(degrees)
         sign_char = LX200Constants.SIGN_POS if sign >= LX200Constants.SIGN_POS_INT else LX200Constants.SIGN_NEG
-        return (
-            f"{sign_char}{deg_value:0{LX200Constants.LAT_DEG_WIDTH}d}"
-            f"{LX200Constants.DEG_MIN_SEP}"
-            f"{minutes:0{LX200Constants.MIN_FIELD_WIDTH}d}"
-            f"{LX200Constants.TIME_SEP}"
-            f"{seconds:0{LX200Constants.TIME_FIELD_WIDTH}d}"
-            f"{LX200Constants.TERMINATOR}"
-        )
+        return _DEC_FORMAT % (sign_char, deg_value, minutes, seconds)
+
+    @classmethod
+    @functools.lru_cache(maxsize=LX200Constants.MODEL_CACHE_SIZE)
+    def interned(cls, degrees: float) -> "LX200Dec":
+        return cls(degrees)
 
     @classmethod
     def from_string(cls, value: str) -> "LX200Dec":
@@ -153,7 +186,7 @@ class LX200Dec:
         return self._format_dec(self.degrees)
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, slots=True)
 class LX200Time:
     hour: int
     minute: int
@@ -169,6 +202,10 @@ class LX200Time:
 
     @classmethod
     def from_string(cls, value: str) -> "LX200Time":
+        fields = _parse_fixed_triplet(value, LX200Constants.TIME_SEP, LX200Constants.TIME_FIELD_WIDTH)
+        if fields is not None:
+            hour, minute, second = fields
+            return cls(hour=hour, minute=minute, second=second)
         parts = value.split(LX200Constants.TIME_SEP)
         if len(parts) == LX200Constants.TIME_PARTS_SHORT:
             hour, minute = (int(p) for p in parts)
@@ -180,13 +217,10 @@ class LX200Time:
         return cls(hour=hour, minute=minute, second=second)
 
     def to_string(self) -> str:
-        hour = f"{self.hour:0{LX200Constants.TIME_FIELD_WIDTH}d}"
-        minute = f"{self.minute:0{LX200Constants.TIME_FIELD_WIDTH}d}"
-        second = f"{self.second:0{LX200Constants.TIME_FIELD_WIDTH}d}"
-        return f"{hour}{LX200Constants.TIME_SEP}{minute}{LX200Constants.TIME_SEP}{second}{LX200Constants.TERMINATOR}"
+        return _TIME_FORMAT % (self.hour, self.minute, self.second)
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, slots=True)
 class LX200Date:
     month: int
     day: int
@@ -206,10 +240,14 @@ class LX200Date:
 
     @classmethod
     def from_string(cls, value: str) -> "LX200Date":
-        parts = value.split(LX200Constants.DATE_SEP)
-        if len(parts) != LX200Constants.DATE_PARTS:
-            raise LX200ValueError(f"invalid date: {value!r}")
-        month, day, year = (int(p) for p in parts)
+        fields = _parse_fixed_triplet(value, LX200Constants.DATE_SEP, LX200Constants.DATE_FIELD_WIDTH)
+        if fields is not None:
+            month, day, year = fields
+        else:
+            parts = value.split(LX200Constants.DATE_SEP)
+            if len(parts) != LX200Constants.DATE_PARTS:
+                raise LX200ValueError(f"invalid date: {value!r}")
+            month, day, year = (int(p) for p in parts)
         if year < (LX200Constants.YEAR_BASE % LX200Constants.CENTURY):
             year += LX200Constants.YEAR_BASE
         else:
@@ -217,14 +255,10 @@ class LX200Date:
         return cls(month=month, day=day, year=year)
 
     def to_string(self) -> str:
-        yy = self.year % LX200Constants.CENTURY
-        month = f"{self.month:0{LX200Constants.DATE_FIELD_WIDTH}d}"
-        day = f"{self.day:0{LX200Constants.DATE_FIELD_WIDTH}d}"
-        year = f"{yy:0{LX200Constants.YEAR_FIELD_WIDTH}d}"
-        return f"{month}{LX200Constants.DATE_SEP}{day}{LX200Constants.DATE_SEP}{year}{LX200Constants.TERMINATOR}"
+        return _DATE_FORMAT % (self.month, self.day, self.year % LX200Constants.CENTURY)
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, slots=True)
 class LX200UtcOffset:
     hours: float
 
@@ -261,7 +295,7 @@ class LX200UtcOffset:
         return f"{self.hours:+.{LX200Constants.UTC_OFFSET_DECIMALS}f}{LX200Constants.TERMINATOR}"
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, slots=True)
 class LX200Site:
     latitude_deg: float
     longitude_west_deg: float
@@ -305,7 +339,7 @@ class LX200Site:
         return cls(latitude_deg=lat_deg, longitude_west_deg=lon_west_deg)
 
     def latitude_to_string(self) -> str:
-        sign, deg, minutes, _ = self._deg_to_dms(self.latitude_deg)
+        sign, deg, minutes, _ = _deg_to_dms(self.latitude_deg)
         sign_char = (
             LX200Constants.SIGN_POS
             if sign == LX200Constants.SIGN_POS_INT
@@ -318,7 +352,7 @@ class LX200Site:
         )
 
     def longitude_to_string(self) -> str:
-        sign, deg, minutes, _ = self._deg_to_dms(self.latitude_deg)
+        sign, deg, minutes, _ = _deg_to_dms(self.latitude_deg)
         sign_char = (
             LX200Constants.SIGN_POS
             if sign == LX200Constants.SIGN_POS_INT
@@ -330,24 +364,6 @@ class LX200Site:
             f"{LX200Constants.TERMINATOR}"
         )
 
-    @staticmethod
-    def _deg_to_dms(deg: float) -> Tuple[int, int, int, int]:
-        sign = LX200Constants.SIGN_POS_INT
-        if deg < LX200Constants.MIN_SECOND:
-            sign = LX200Constants.SIGN_NEG_INT
-            deg = -deg
-        degrees = int(deg)
-        remainder = (deg - degrees) * LX200Constants.MIN_PER_DEG
-        minutes = int(remainder)
-        seconds = int(round((remainder - minutes) * LX200Constants.SECONDS_PER_MINUTE))
-        if seconds == LX200Constants.SECONDS_PER_MINUTE:
-            seconds = LX200Constants.MIN_SECOND
-            minutes += LX200Constants.SIGN_POS_INT
-        if minutes == LX200Constants.MIN_PER_DEG:
-            minutes = LX200Constants.MIN_MINUTE
-            degrees += LX200Constants.SIGN_POS_INT
-        return sign, degrees, minutes, seconds
-
     @staticmethod
     def format_latitude(latitude_deg: float) -> str:
         site = LX200Site(latitude_deg=latitude_deg, longitude_west_deg=LX200Constants.MIN_LON_DEG)
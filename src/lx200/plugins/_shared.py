@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+from typing import Any, Callable, Optional, Tuple, TypeVar
+
+from ..protocol import LX200Command, LX200Constants, LX200ParseError
+
+TValue = TypeVar("TValue")
+
+_NO_ARGS: Tuple[()] = ()
+_RESPONSE_OK = LX200Constants.RESPONSE_OK
+_RESPONSE_ERR = LX200Constants.RESPONSE_ERR
+_RESPONSE_EMPTY = LX200Constants.RESPONSE_EMPTY
+
+
+def parse_no_arg(arg: Optional[str]) -> Tuple[()]:
+    if arg:
+        raise LX200ParseError(f"unexpected arg: {arg!r}")
+    return _NO_ARGS
+
+
+def format_ok(accepted: bool) -> str:
+    return _RESPONSE_OK if accepted else _RESPONSE_ERR
+
+
+def format_empty(_: Optional[object]) -> str:
+    return _RESPONSE_EMPTY
+
+
+class EpochCache:
+    """Backend getter results that stay valid until the next ``invalidate()``."""
+
+    __slots__ = ("_epoch", "_values")
+
+    def __init__(self) -> None:
+        self._epoch = 0
+        self._values: dict[LX200Command, tuple[int, Any]] = {}
+
+    def invalidate(self) -> None:
+        self._epoch += 1
+
+    def get(self, command: LX200Command, getter: Callable[[], TValue]) -> TValue:
+        epoch = self._epoch
+        entry = self._values.get(command)
+        if entry is not None and entry[0] == epoch:
+            value: TValue = entry[1]
+            return value
+        value = getter()
+        self._values[command] = (epoch, value)
+        return value
@@ -3,13 +3,10 @@ from __future__ import annotations
 from typing import Any, Optional, Protocol, Tuple
 
 from ..protocol import LX200Command, LX200Constants, LX200ParseError
-from ..server import CommandSpec
+from ..server import CommandSpec, SpecTemplate, bind_backend_specs
+from ._shared import format_ok, parse_no_arg
 
-
-def parse_no_arg(arg: Optional[str]) -> Tuple[()]:
-    if arg:
-        raise LX200ParseError(f"unexpected arg: {arg!r}")
-    return ()
+_TERMINATOR = LX200Constants.TERMINATOR
 
 
 def parse_object_size_arg(arg: Optional[str]) -> Tuple[str]:
@@ -18,12 +15,8 @@ def parse_object_size_arg(arg: Optional[str]) -> Tuple[str]:
     return (arg,)
 
 
-def format_ok(accepted: bool) -> str:
-    return LX200Constants.RESPONSE_OK if accepted else LX200Constants.RESPONSE_ERR
-
-
 def format_distance(value: str) -> str:
-    return f"{value}{LX200Constants.TERMINATOR}"
+    return value + _TERMINATOR
 
 
 class LX200ObjectBackend(Protocol):
@@ -35,17 +28,16 @@ class LX200ObjectBackend(Protocol):
 
 
 class LX200ObjectPlugin:
+    __slots__ = ("_backend",)
+
     def __init__(self, backend: LX200ObjectBackend) -> None:
         self._backend = backend
 
     def specs(self) -> list[CommandSpec[Any]]:
-        return [
-            CommandSpec(LX200Command.SET_OBJECT_SIZE, parse_object_size_arg, self.set_object_size, format_ok),
-            CommandSpec(LX200Command.GET_DISTANCE, parse_no_arg, self.get_distance, format_distance),
-        ]
+        return bind_backend_specs(self._backend, _BACKEND_SPECS)
 
-    def set_object_size(self, value: str) -> bool:
-        return self._backend.set_object_size(value)
 
-    def get_distance(self) -> str:
-        return self._backend.get_distance()
+_BACKEND_SPECS: tuple[SpecTemplate, ...] = (
+    (LX200Command.SET_OBJECT_SIZE, parse_object_size_arg, LX200ObjectBackend.set_object_size, format_ok),
+    (LX200Command.GET_DISTANCE, parse_no_arg, LX200ObjectBackend.get_distance, format_distance),
+)
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from typing import Any, Optional, Protocol, Tuple
+import functools
+from typing import Any, Callable, Optional, Protocol, Tuple
 
 from ..models import LX200Dec, LX200Ra
 from ..protocol import (
@@ -11,21 +12,20 @@ from ..protocol import (
     LX200ParseError,
     LX200SyncResult,
 )
-from ..server import CommandSpec
+from ..server import CommandSpec, SpecTemplate, bind_backend_specs, bind_specs
+from ._shared import format_empty, format_ok, parse_no_arg
 
-
-def parse_no_arg(arg: Optional[str]) -> Tuple[()]:
-    if arg:
-        raise LX200ParseError(f"unexpected arg: {arg!r}")
-    return ()
+_TERMINATOR = LX200Constants.TERMINATOR
 
 
+@functools.lru_cache(maxsize=LX200Constants.PARSE_CACHE_SIZE)
 def parse_ra_arg(arg: Optional[str]) -> Tuple[LX200Ra]:
     if arg is None:
         raise LX200ParseError("missing RA argument")
     return (LX200Ra.from_string(arg),)
 
 
+@functools.lru_cache(maxsize=LX200Constants.PARSE_CACHE_SIZE)
 def parse_dec_arg(arg: Optional[str]) -> Tuple[LX200Dec]:
     if arg is None:
         raise LX200ParseError("missing DEC argument")
@@ -42,12 +42,14 @@ def parse_stop_arg(arg: Optional[str]) -> Tuple[Optional[LX200MoveDirection]]:
         raise LX200ParseError(f"invalid direction: {arg!r}") from exc
 
 
-def format_ok(accepted: bool) -> str:
-    return LX200Constants.RESPONSE_OK if accepted else LX200Constants.RESPONSE_ERR
+def move_arg_parser(direction: LX200MoveDirection) -> Callable[[Optional[str]], Tuple[LX200MoveDirection]]:
+    args = (direction,)
 
+    def parse_move_arg(arg: Optional[str]) -> Tuple[LX200MoveDirection]:
+        parse_no_arg(arg)
+        return args
 
-def format_empty(_: Optional[object]) -> str:
-    return LX200Constants.RESPONSE_EMPTY
+    return parse_move_arg
 
 
 def format_ra(value: LX200Ra) -> str:
@@ -63,7 +65,7 @@ def format_goto(value: LX200GotoResult) -> str:
 
 
 def format_sync(value: LX200SyncResult) -> str:
-    return f"{value.value}{LX200Constants.TERMINATOR}"
+    return value.value + _TERMINATOR
 
 
 class LX200PointingBackend(Protocol):
@@ -96,41 +98,13 @@ class LX200PointingBackend(Protocol):
 
 
 class LX200PointingPlugin:
+    __slots__ = ("_backend",)
+
     def __init__(self, backend: LX200PointingBackend) -> None:
         self._backend = backend
 
     def specs(self) -> list[CommandSpec[Any]]:
-        return [
-            CommandSpec(LX200Command.GET_RA, parse_no_arg, self.get_current_ra, format_ra),
-            CommandSpec(LX200Command.GET_DEC, parse_no_arg, self.get_current_dec, format_dec),
-            CommandSpec(LX200Command.SET_RA, parse_ra_arg, self.set_target_ra, format_ok),
-            CommandSpec(LX200Command.SET_DEC, parse_dec_arg, self.set_target_dec, format_ok),
-            CommandSpec(LX200Command.GOTO, parse_no_arg, self.slew_to_target, format_goto),
-            CommandSpec(LX200Command.SYNC, parse_no_arg, self.sync_to_target, format_sync),
-            CommandSpec(LX200Command.STOP, parse_stop_arg, self.stop, format_empty),
-            CommandSpec(LX200Command.MOVE_NORTH, parse_no_arg, self.start_move_north, format_empty),
-            CommandSpec(LX200Command.MOVE_SOUTH, parse_no_arg, self.start_move_south, format_empty),
-            CommandSpec(LX200Command.MOVE_EAST, parse_no_arg, self.start_move_east, format_empty),
-            CommandSpec(LX200Command.MOVE_WEST, parse_no_arg, self.start_move_west, format_empty),
-        ]
-
-    def get_current_ra(self) -> LX200Ra:
-        return self._backend.get_current_ra()
-
-    def get_current_dec(self) -> LX200Dec:
-        return self._backend.get_current_dec()
-
-    def set_target_ra(self, ra: LX200Ra) -> bool:
-        return self._backend.set_target_ra(ra)
-
-    def set_target_dec(self, dec: LX200Dec) -> bool:
-        return self._backend.set_target_dec(dec)
-
-    def slew_to_target(self) -> LX200GotoResult:
-        return self._backend.slew_to_target()
-
-    def sync_to_target(self) -> LX200SyncResult:
-        return self._backend.sync_to_target()
+        return bind_backend_specs(self._backend, _BACKEND_SPECS) + bind_specs(self, _SPECS)
 
     def stop(self, direction: Optional[LX200MoveDirection]) -> None:
         if direction is None:
@@ -139,18 +113,20 @@ class LX200PointingPlugin:
         self._backend.stop_move(direction)
         return None
 
-    def start_move_north(self) -> None:
-        self._backend.start_move(LX200MoveDirection.NORTH)
-        return None
-
-    def start_move_south(self) -> None:
-        self._backend.start_move(LX200MoveDirection.SOUTH)
-        return None
 
-    def start_move_east(self) -> None:
-        self._backend.start_move(LX200MoveDirection.EAST)
-        return None
+_BACKEND_SPECS: tuple[SpecTemplate, ...] = (
+    (LX200Command.GET_RA, parse_no_arg, LX200PointingBackend.get_current_ra, format_ra),
+    (LX200Command.GET_DEC, parse_no_arg, LX200PointingBackend.get_current_dec, format_dec),
+    (LX200Command.SET_RA, parse_ra_arg, LX200PointingBackend.set_target_ra, format_ok),
+    (LX200Command.SET_DEC, parse_dec_arg, LX200PointingBackend.set_target_dec, format_ok),
+    (LX200Command.GOTO, parse_no_arg, LX200PointingBackend.slew_to_target, format_goto),
+    (LX200Command.SYNC, parse_no_arg, LX200PointingBackend.sync_to_target, format_sync),
+    (LX200Command.MOVE_NORTH, move_arg_parser(LX200MoveDirection.NORTH), LX200PointingBackend.start_move, format_empty),
+    (LX200Command.MOVE_SOUTH, move_arg_parser(LX200MoveDirection.SOUTH), LX200PointingBackend.start_move, format_empty),
+    (LX200Command.MOVE_EAST, move_arg_parser(LX200MoveDirection.EAST), LX200PointingBackend.start_move, format_empty),
+    (LX200Command.MOVE_WEST, move_arg_parser(LX200MoveDirection.WEST), LX200PointingBackend.start_move, format_empty),
+)
 
-    def start_move_west(self) -> None:
-        self._backend.start_move(LX200MoveDirection.WEST)
-        return None
+_SPECS: tuple[SpecTemplate, ...] = (
+    (LX200Command.STOP, parse_stop_arg, LX200PointingPlugin.stop, format_empty),
+)
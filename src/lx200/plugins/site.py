@@ -1,44 +1,42 @@
 from __future__ import annotations
 
+import functools
 from typing import Any, Optional, Protocol, Tuple
 
 from ..models import LX200Site
 from ..protocol import LX200Command, LX200Constants, LX200ParseError
-from ..server import CommandSpec
+from ..server import CommandSpec, SpecTemplate, bind_specs
+from ._shared import EpochCache, format_ok, parse_no_arg
 
-
-def parse_no_arg(arg: Optional[str]) -> Tuple[()]:
-    if arg:
-        raise LX200ParseError(f"unexpected arg: {arg!r}")
-    return ()
+_TERMINATOR = LX200Constants.TERMINATOR
 
 
+@functools.lru_cache(maxsize=LX200Constants.PARSE_CACHE_SIZE)
 def parse_latitude_arg(arg: Optional[str]) -> Tuple[float]:
     if arg is None:
         raise LX200ParseError("missing latitude argument")
     return (LX200Site.latitude_from_string(arg),)
 
 
+@functools.lru_cache(maxsize=LX200Constants.PARSE_CACHE_SIZE)
 def parse_longitude_arg(arg: Optional[str]) -> Tuple[float]:
     if arg is None:
         raise LX200ParseError("missing longitude argument")
     return (LX200Site.longitude_from_string(arg),)
 
 
-def format_ok(accepted: bool) -> str:
-    return LX200Constants.RESPONSE_OK if accepted else LX200Constants.RESPONSE_ERR
-
-
+@functools.lru_cache(maxsize=LX200Constants.RESPONSE_CACHE_SIZE)
 def format_latitude(value: float) -> str:
     return LX200Site.format_latitude(value)
 
 
+@functools.lru_cache(maxsize=LX200Constants.RESPONSE_CACHE_SIZE)
 def format_longitude(value: float) -> str:
     return LX200Site.format_longitude(value)
 
 
 def format_site_name(value: str) -> str:
-    return f"{value}{LX200Constants.TERMINATOR}"
+    return value + _TERMINATOR
 
 
 class LX200SiteBackend(Protocol):
@@ -59,29 +57,42 @@ class LX200SiteBackend(Protocol):
 
 
 class LX200SitePlugin:
+    __slots__ = ("_backend", "_cache")
+
     def __init__(self, backend: LX200SiteBackend) -> None:
         self._backend = backend
+        self._cache = EpochCache()
+
+    def invalidate(self) -> None:
+        self._cache.invalidate()
 
     def specs(self) -> list[CommandSpec[Any]]:
-        return [
-            CommandSpec(LX200Command.SET_LATITUDE, parse_latitude_arg, self.set_latitude, format_ok),
-            CommandSpec(LX200Command.SET_LONGITUDE, parse_longitude_arg, self.set_longitude, format_ok),
-            CommandSpec(LX200Command.GET_LATITUDE, parse_no_arg, self.get_latitude, format_latitude),
-            CommandSpec(LX200Command.GET_LONGITUDE, parse_no_arg, self.get_longitude, format_longitude),
-            CommandSpec(LX200Command.GET_SITE_NAME, parse_no_arg, self.get_site_name, format_site_name),
-        ]
+        return bind_specs(self, _SPECS)
 
     def set_latitude(self, latitude_deg: float) -> bool:
-        return self._backend.set_latitude(latitude_deg)
+        accepted = self._backend.set_latitude(latitude_deg)
+        self._cache.invalidate()
+        return accepted
 
     def set_longitude(self, longitude_west_deg: float) -> bool:
-        return self._backend.set_longitude(longitude_west_deg)
+        accepted = self._backend.set_longitude(longitude_west_deg)
+        self._cache.invalidate()
+        return accepted
 
     def get_latitude(self) -> float:
-        return self._backend.get_latitude()
+        return self._cache.get(LX200Command.GET_LATITUDE, self._backend.get_latitude)
 
     def get_longitude(self) -> float:
-        return self._backend.get_longitude()
+        return self._cache.get(LX200Command.GET_LONGITUDE, self._backend.get_longitude)
 
     def get_site_name(self) -> str:
-        return self._backend.get_site_name()
+        return self._cache.get(LX200Command.GET_SITE_NAME, self._backend.get_site_name)
+
+
+_SPECS: tuple[SpecTemplate, ...] = (
+    (LX200Command.SET_LATITUDE, parse_latitude_arg, LX200SitePlugin.set_latitude, format_ok),
+    (LX200Command.SET_LONGITUDE, parse_longitude_arg, LX200SitePlugin.set_longitude, format_ok),
+    (LX200Command.GET_LATITUDE, parse_no_arg, LX200SitePlugin.get_latitude, format_latitude),
+    (LX200Command.GET_LONGITUDE, parse_no_arg, LX200SitePlugin.get_longitude, format_longitude),
+    (LX200Command.GET_SITE_NAME, parse_no_arg, LX200SitePlugin.get_site_name, format_site_name),
+)
@@ -1,40 +1,35 @@
 from __future__ import annotations
 
+import functools
 from typing import Any, Optional, Protocol, Tuple
 
 from ..models import LX200Date, LX200Time, LX200UtcOffset
 from ..protocol import LX200Command, LX200Constants, LX200ParseError
-from ..server import CommandSpec
-
-
-def parse_no_arg(arg: Optional[str]) -> Tuple[()]:
-    if arg:
-        raise LX200ParseError(f"unexpected arg: {arg!r}")
-    return ()
+from ..server import CommandSpec, SpecTemplate, bind_backend_specs, bind_specs
+from ._shared import EpochCache, format_ok, parse_no_arg
 
 
+@functools.lru_cache(maxsize=LX200Constants.PARSE_CACHE_SIZE)
 def parse_time_arg(arg: Optional[str]) -> Tuple[LX200Time]:
     if arg is None:
         raise LX200ParseError("missing local time argument")
     return (LX200Time.from_string(arg),)
 
 
+@functools.lru_cache(maxsize=LX200Constants.PARSE_CACHE_SIZE)
 def parse_date_arg(arg: Optional[str]) -> Tuple[LX200Date]:
     if arg is None:
         raise LX200ParseError("missing date argument")
     return (LX200Date.from_string(arg),)
 
 
+@functools.lru_cache(maxsize=LX200Constants.PARSE_CACHE_SIZE)
 def parse_utc_offset_arg(arg: Optional[str]) -> Tuple[LX200UtcOffset]:
     if arg is None:
         raise LX200ParseError("missing UTC offset argument")
     return (LX200UtcOffset.from_string(arg),)
 
 
-def format_ok(accepted: bool) -> str:
-    return LX200Constants.RESPONSE_OK if accepted else LX200Constants.RESPONSE_ERR
-
-
 def format_time(value: LX200Time) -> str:
     return value.to_string()
 
@@ -43,6 +38,7 @@ def format_date(value: LX200Date) -> str:
     return value.to_string()
 
 
+@functools.lru_cache(maxsize=LX200Constants.RESPONSE_CACHE_SIZE)
 def format_utc_offset(value: LX200UtcOffset) -> str:
     return value.to_string()
 
@@ -68,37 +64,36 @@ class LX200TimeBackend(Protocol):
 
 
 class LX200TimePlugin:
+    __slots__ = ("_backend", "_cache")
+
     def __init__(self, backend: LX200TimeBackend) -> None:
         self._backend = backend
+        self._cache = EpochCache()
 
-    def specs(self) -> list[CommandSpec[Any]]:
-        return [
-            CommandSpec(LX200Command.SET_LOCAL_TIME, parse_time_arg, self.set_local_time, format_ok),
-            CommandSpec(LX200Command.SET_DATE, parse_date_arg, self.set_date, format_ok),
-            CommandSpec(LX200Command.SET_UTC_OFFSET, parse_utc_offset_arg, self.set_utc_offset, format_ok),
-            CommandSpec(LX200Command.GET_LOCAL_TIME, parse_no_arg, self.get_local_time, format_time),
-            CommandSpec(LX200Command.GET_DATE, parse_no_arg, self.get_date, format_date),
-            CommandSpec(LX200Command.GET_DATE_ALT, parse_no_arg, self.get_date_alt, format_date),
-            CommandSpec(LX200Command.GET_UTC_OFFSET, parse_no_arg, self.get_utc_offset, format_utc_offset),
-        ]
-
-    def set_local_time(self, value: LX200Time) -> bool:
-        return self._backend.set_local_time(value)
+    def invalidate(self) -> None:
+        self._cache.invalidate()
 
-    def set_date(self, value: LX200Date) -> bool:
-        return self._backend.set_date(value)
+    def specs(self) -> list[CommandSpec[Any]]:
+        return bind_backend_specs(self._backend, _BACKEND_SPECS) + bind_specs(self, _SPECS)
 
     def set_utc_offset(self, value: LX200UtcOffset) -> bool:
-        return self._backend.set_utc_offset(value)
+        accepted = self._backend.set_utc_offset(value)
+        self._cache.invalidate()
+        return accepted
 
-    def get_local_time(self) -> LX200Time:
-        return self._backend.get_local_time()
+    def get_utc_offset(self) -> LX200UtcOffset:
+        return self._cache.get(LX200Command.GET_UTC_OFFSET, self._backend.get_utc_offset)
 
-    def get_date(self) -> LX200Date:
-        return self._backend.get_date()
 
-    def get_date_alt(self) -> LX200Date:
-        return self._backend.get_date()
+_BACKEND_SPECS: tuple[SpecTemplate, ...] = (
+    (LX200Command.SET_LOCAL_TIME, parse_time_arg, LX200TimeBackend.set_local_time, format_ok),
+    (LX200Command.SET_DATE, parse_date_arg, LX200TimeBackend.set_date, format_ok),
+    (LX200Command.GET_LOCAL_TIME, parse_no_arg, LX200TimeBackend.get_local_time, format_time),
+    (LX200Command.GET_DATE, parse_no_arg, LX200TimeBackend.get_date, format_date),
+    (LX200Command.GET_DATE_ALT, parse_no_arg, LX200TimeBackend.get_date, format_date),
+)
 
-    def get_utc_offset(self) -> LX200UtcOffset:
-        return self._backend.get_utc_offset()
+_SPECS: tuple[SpecTemplate, ...] = (
+    (LX200Command.SET_UTC_OFFSET, parse_utc_offset_arg, LX200TimePlugin.set_utc_offset, format_ok),
+    (LX200Command.GET_UTC_OFFSET, parse_no_arg, LX200TimePlugin.get_utc_offset, format_utc_offset),
+)
@@ -1,23 +1,16 @@
 from __future__ import annotations
 
-from typing import Any, Optional, Protocol, Tuple
+from typing import Any, Protocol
 
-from ..protocol import LX200Command, LX200Constants, LX200ParseError, LX200SlewRate
-from ..server import CommandSpec
+from ..protocol import LX200Command, LX200Constants, LX200SlewRate
+from ..server import CommandSpec, SpecTemplate, bind_backend_specs, bind_specs
+from ._shared import format_empty, parse_no_arg
 
-
-def parse_no_arg(arg: Optional[str]) -> Tuple[()]:
-    if arg:
-        raise LX200ParseError(f"unexpected arg: {arg!r}")
-    return ()
-
-
-def format_empty(_: Optional[object]) -> str:
-    return LX200Constants.RESPONSE_EMPTY
+_TERMINATOR = LX200Constants.TERMINATOR
 
 
 def format_tracking_rate(value: str) -> str:
-    return f"{value}{LX200Constants.TERMINATOR}"
+    return value + _TERMINATOR
 
 
 class LX200TrackingBackend(Protocol):
@@ -29,17 +22,13 @@ class LX200TrackingBackend(Protocol):
 
 
 class LX200TrackingPlugin:
+    __slots__ = ("_backend",)
+
     def __init__(self, backend: LX200TrackingBackend) -> None:
         self._backend = backend
 
     def specs(self) -> list[CommandSpec[Any]]:
-        return [
-            CommandSpec(LX200Command.RATE_GUIDE, parse_no_arg, self.set_rate_guide, format_empty),
-            CommandSpec(LX200Command.RATE_CENTER, parse_no_arg, self.set_rate_center, format_empty),
-            CommandSpec(LX200Command.RATE_FIND, parse_no_arg, self.set_rate_find, format_empty),
-            CommandSpec(LX200Command.RATE_SLEW, parse_no_arg, self.set_rate_slew, format_empty),
-            CommandSpec(LX200Command.GET_TRACKING_RATE, parse_no_arg, self.get_tracking_rate, format_tracking_rate),
-        ]
+        return bind_backend_specs(self._backend, _BACKEND_SPECS) + bind_specs(self, _SPECS)
 
     def set_rate_guide(self) -> None:
         self._backend.set_slew_rate(LX200SlewRate.GUIDE)
@@ -57,5 +46,14 @@ class LX200TrackingPlugin:
         self._backend.set_slew_rate(LX200SlewRate.SLEW)
         return None
 
-    def get_tracking_rate(self) -> str:
-        return self._backend.get_tracking_rate()
+
+_BACKEND_SPECS: tuple[SpecTemplate, ...] = (
+    (LX200Command.GET_TRACKING_RATE, parse_no_arg, LX200TrackingBackend.get_tracking_rate, format_tracking_rate),
+)
+
+_SPECS: tuple[SpecTemplate, ...] = (
+    (LX200Command.RATE_GUIDE, parse_no_arg, LX200TrackingPlugin.set_rate_guide, format_empty),
+    (LX200Command.RATE_CENTER, parse_no_arg, LX200TrackingPlugin.set_rate_center, format_empty),
+    (LX200Command.RATE_FIND, parse_no_arg, LX200TrackingPlugin.set_rate_find, format_empty),
+    (LX200Command.RATE_SLEW, parse_no_arg, LX200TrackingPlugin.set_rate_slew, format_empty),
+)
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import dataclasses
+import re
 from enum import StrEnum
 from typing import Optional
 
@@ -8,6 +9,9 @@ from typing import Optional
 class LX200Constants:
     PREFIX = ":"
     TERMINATOR = "#"
+    ENCODING = "ascii"
+    PREFIX_BYTES = PREFIX.encode(ENCODING)
+    TERMINATOR_BYTES = TERMINATOR.encode(ENCODING)
     TIME_SEP = ":"
     DATE_SEP = "/"
     DEG_MIN_SEP = "*"
@@ -66,6 +70,9 @@ class LX200Constants:
     DEFAULT_SITE_NAME = "LX200"
     DEFAULT_TRACKING_RATE = "0"
     DEFAULT_DISTANCE = "0"
+    MODEL_CACHE_SIZE = 1024
+    RESPONSE_CACHE_SIZE = 64
+    PARSE_CACHE_SIZE = 256
 
 
 class LX200Error(Exception):
@@ -147,7 +154,71 @@ class LX200CommandRequest:
     arg: Optional[str]
 
 
+_COMMANDS: dict[str, LX200Command] = {command.value: command for command in LX200Command}
+_COMMANDS_BYTES: dict[bytes, LX200Command] = {
+    command.value.encode(LX200Constants.ENCODING): command for command in LX200Command
+}
+_BODY_CHAR = f"[^{re.escape(LX200Constants.TERMINATOR)}]"
+_REQUEST_SOURCE = (
+    rf"\s*{re.escape(LX200Constants.PREFIX)}(?:"
+    rf"({re.escape(LX200Command.STOP.value)})({_BODY_CHAR}{{0,{LX200Constants.MOVE_DIR_LEN}}})"
+    rf"|([^{re.escape(LX200Constants.TERMINATOR + LX200Command.STOP.value)}]"
+    rf"{_BODY_CHAR}{{{LX200Constants.CMD_LEN - LX200Constants.SINGLE_CMD_LEN}}})({_BODY_CHAR}*)"
+    rf"|({_BODY_CHAR}{{{LX200Constants.SINGLE_CMD_LEN}}})"
+    rf"){re.escape(LX200Constants.TERMINATOR)}\s*"
+)
+_REQUEST_PATTERN = re.compile(_REQUEST_SOURCE)
+_REQUEST_PATTERN_BYTES = re.compile(_REQUEST_SOURCE.encode(LX200Constants.ENCODING))
+
+
+def split_request(raw: str) -> tuple[LX200Command, Optional[str]]:
+    """Split a framed request into its command and optional argument.
+
+    Well-formed requests are matched by one precompiled pattern and a dict lookup;
+    anything else goes through the step-by-step parser to get the precise error.
+    """
+    match = _REQUEST_PATTERN.fullmatch(raw)
+    if match is None:
+        request = _parse_request_framing(raw)
+        return request.command, request.arg
+    stop, stop_arg, cmd_text, arg, single = match.groups()
+    if stop is not None:
+        return LX200Command.STOP, stop_arg or None
+    if cmd_text is None:
+        cmd_text = single
+    command = _COMMANDS.get(cmd_text)
+    if command is None:
+        raise LX200UnsupportedCommandError(f"unknown command: {cmd_text!r}")
+    return command, arg or None
+
+
+def split_request_bytes(raw: bytes) -> tuple[LX200Command, Optional[str]]:
+    """Bytes counterpart of ``split_request()`` for requests read straight off the wire."""
+    match = _REQUEST_PATTERN_BYTES.fullmatch(raw)
+    if match is None or not raw.isascii():
+        return split_request(_decode_request(raw))
+    stop, stop_arg, cmd_text, arg, single = match.groups()
+    if stop is not None:
+        return LX200Command.STOP, stop_arg.decode(LX200Constants.ENCODING) or None
+    command = _COMMANDS_BYTES.get(single if cmd_text is None else cmd_text)
+    if command is None:
+        return split_request(_decode_request(raw))
+    return command, arg.decode(LX200Constants.ENCODING) if arg else None
+
+
+def _decode_request(raw: bytes) -> str:
+    try:
+        return raw.decode(LX200Constants.ENCODING)
+    except UnicodeDecodeError as exc:
+        raise LX200ParseError(f"non-ASCII request: {raw!r}") from exc
+
+
 def parse_request(raw: str) -> LX200CommandRequest:
+    command, arg = split_request(raw)
+    return LX200CommandRequest(command=command, arg=arg)
+
+
+def _parse_request_framing(raw: str) -> LX200CommandRequest:
     raw = raw.strip()
     if not raw.startswith(LX200Constants.PREFIX) or not raw.endswith(LX200Constants.TERMINATOR):
         raise LX200ParseError(f"invalid framing: {raw!r}")
@@ -6,23 +6,50 @@ from typing import Any, Callable, Generic, Optional, Protocol, TypeVar
 
 from .protocol import (
     LX200Command,
-    LX200ParseError,
+    LX200Constants,
     LX200UnsupportedCommandError,
     LX200ValueError,
-    parse_request,
+    split_request,
+    split_request_bytes,
 )
 
 TResult = TypeVar("TResult")
+SpecTemplate = tuple[
+    LX200Command,
+    Callable[[Optional[str]], tuple[Any, ...]],
+    Callable[..., Any],
+    Callable[[Any], str],
+]
+CommandEntry = tuple[
+    Callable[[Optional[str]], tuple[Any, ...]],
+    object,
+    Callable[..., Any],
+    Callable[[Any], str],
+]
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, slots=True)
 class CommandSpec(Generic[TResult]):
     command: LX200Command
     parse: Callable[[Optional[str]], tuple[Any, ...]]
+    owner: object
     handler: Callable[..., TResult]
     format: Callable[[TResult], str]
 
 
+def bind_specs(owner: object, templates: tuple[SpecTemplate, ...]) -> list[CommandSpec[Any]]:
+    return [CommandSpec(command, parse, owner, handler, fmt) for command, parse, handler, fmt in templates]
+
+
+def bind_backend_specs(backend: object, templates: tuple[SpecTemplate, ...]) -> list[CommandSpec[Any]]:
+    """Resolve templates naming backend Protocol methods to the backend's own implementations."""
+    backend_type = type(backend)
+    return [
+        CommandSpec(command, parse, backend, getattr(backend_type, handler.__name__), fmt)
+        for command, parse, handler, fmt in templates
+    ]
+
+
 class LX200Plugin(Protocol):
     def specs(self) -> list[CommandSpec[Any]]:
         raise NotImplementedError
@@ -32,26 +59,35 @@ class LX200CommandHandler(Protocol):
     def handle_command(self, raw: str) -> str:
         raise NotImplementedError
 
+    def handle_command_bytes(self, raw: bytes) -> bytes:
+        raise NotImplementedError
+
 
 class LX200Server:
+    __slots__ = ("log", "_table")
+
     def __init__(self, plugins: list[LX200Plugin], logger: Optional[logging.Logger] = None) -> None:
         self.log = logger or logging.getLogger("lx200.server")
-        self._specs: dict[LX200Command, CommandSpec[Any]] = {}
+        self._table: dict[LX200Command, CommandEntry] = {}
         for plugin in plugins:
             for spec in plugin.specs():
-                if spec.command in self._specs:
+                if spec.command in self._table:
                     raise LX200ValueError(f"duplicate handler: {spec.command!r}")
-                self._specs[spec.command] = spec
+                self._table[spec.command] = (spec.parse, spec.owner, spec.handler, spec.format)
 
     def handle_command(self, raw: str) -> str:
-        request = parse_request(raw)
-        self.log.debug("lx200 rx command=%s arg=%r", request.command.name, request.arg)
-        spec = self._specs.get(request.command)
-        if spec is None:
-            raise LX200UnsupportedCommandError(f"unsupported command {request.command!r}")
-        try:
-            args = spec.parse(request.arg)
-        except LX200ParseError:
-            raise
-        result = spec.handler(*args)
-        return spec.format(result)
+        command, arg = split_request(raw)
+        return self._dispatch(command, arg)
+
+    def handle_command_bytes(self, raw: bytes) -> bytes:
+        command, arg = split_request_bytes(raw)
+        return self._dispatch(command, arg).encode(LX200Constants.ENCODING)
+
+    def _dispatch(self, command: LX200Command, arg: Optional[str]) -> str:
+        if self.log.isEnabledFor(logging.DEBUG):
+            self.log.debug("lx200 rx command=%s arg=%r", command.name, arg)
+        entry = self._table.get(command)
+        if entry is None:
+            raise LX200UnsupportedCommandError(f"unsupported command {command!r}")
+        parse, owner, handler, fmt = entry
+        return fmt(handler(owner, *parse(arg)))
@@ -1,10 +1,12 @@
 from __future__ import annotations
 
 import dataclasses
+import functools
 import logging
+import operator
 import os
 import time
-from typing import Callable, Optional
+from typing import Callable, Iterator, Optional
 
 import pytest
 
@@ -15,6 +17,23 @@ HIGH_SPEED_PERIOD = 1
 SIDEREAL_RATE_DEG_S = 360.0 / 86164.0905
 TRACKING_MIN_TICK_DELTA = 1
 TRACKING_STOP_MAX_TICK_DELTA = 100
+SLEW_MIN_TICK_DELTA = 10
+SLEW_TICK_FRACTION = 4
+SLEW_TIMEOUT_FACTOR = 2
+STATE_POLL_INTERVAL_S = 0.02
+SERIAL_TIMEOUT_MIN_S = 0.05
+SERIAL_TIMEOUT_POLL_DIVISOR = 4
+SERIAL_TIMEOUT_WIRE_MARGIN = 2
+SERIAL_BITS_PER_BYTE = 10
+SERIAL_MAX_REQUEST_BYTES = 10
+SERIAL_MAX_REPLY_BYTES = 8
+SERIAL_MAX_PIPELINED_FRAMES = 4
+NS_PER_S = 1_000_000_000
+TICK_MASK = 0xFFFFFF
+TICK_MODULUS = TICK_MASK + 1
+TICK_HALF = TICK_MODULUS // 2
+AXIS_CHANNELS_SEP = ","
+COMPUTE_CACHE_SIZE = 32
 
 from lib.coords import clamp
 from lib.serial_prims import SerialLineDevice
@@ -26,9 +45,16 @@ from lib.skywatcher import (
     SkyWatcherMotionMode,
     SkyWatcherSlewMode,
     SkyWatcherSpeedMode,
+    SkyWatcherStateSample,
     SkyWatcherStatus,
 )
 
+SKYWATCHER_AXIS_CHANNELS = tuple(
+    channel.strip()
+    for channel in os.environ.get("SKYWATCHER_AXES", os.environ.get("SKYWATCHER_AXIS", "1")).split(AXIS_CHANNELS_SEP)
+    if channel.strip()
+)
+
 
 @dataclasses.dataclass(frozen=True)
 class SkyWatcherTestConfig:
@@ -66,16 +92,36 @@ class SkyWatcherTestConfig:
             raise ValueError("Manual rate must be positive.")
 
 
+@dataclasses.dataclass(frozen=True)
+class SkyWatcherTestParams:
+    cpr: int
+    timer_freq: int
+    goto_delta: int
+    step_period_manual: int
+    step_period_sidereal: int
+    slew_tick_delta: int
+    fwd_lowspeed_goto_mode: SkyWatcherMotionMode
+    bwd_lowspeed_goto_mode: SkyWatcherMotionMode
+    fwd_lowspeed_slew_mode: SkyWatcherMotionMode
+    bwd_lowspeed_slew_mode: SkyWatcherMotionMode
+
+    def __post_init__(self) -> None:
+        if self.cpr < 1:
+            raise ValueError("CPR must be positive.")
+        if self.timer_freq < 1:
+            raise ValueError("Timer frequency must be positive.")
+
+
 def _mask_ticks(value: int) -> int:
-    return int(value) & 0xFFFFFF
+    return int(value) & TICK_MASK
 
 
 def _tick_delta(a: int, b: int) -> int:
-    forward = _mask_ticks(a - b)
-    backward = _mask_ticks(b - a)
-    return min(forward, backward)
+    d = (a - b) & TICK_MASK
+    return d if d <= TICK_HALF else TICK_MODULUS - d
 
 
+@functools.lru_cache(maxsize=COMPUTE_CACHE_SIZE)
 def _compute_goto_delta(cpr: int) -> int:
     if cpr <= 0:
         return 50
@@ -83,6 +129,12 @@ def _compute_goto_delta(cpr: int) -> int:
     return max(50, int(scaled))
 
 
+def _compute_slew_tick_delta(cpr: int, rate_deg_s: float, duration_s: float) -> int:
+    expected = int(cpr * rate_deg_s * duration_s / 360.0)
+    return max(SLEW_MIN_TICK_DELTA, expected // SLEW_TICK_FRACTION)
+
+
+@functools.lru_cache(maxsize=COMPUTE_CACHE_SIZE)
 def _compute_step_period(cpr: int, timer_freq: int, rate_deg_s: float) -> int:
     if cpr <= 0:
         raise ValueError("CPR must be positive.")
@@ -94,78 +146,119 @@ def _compute_step_period(cpr: int, timer_freq: int, rate_deg_s: float) -> int:
     return bounded
 
 
+@functools.lru_cache(maxsize=None)
+def _motion_mode(
+    slew_mode: SkyWatcherSlewMode,
+    direction: SkyWatcherDirection,
+    speed_mode: SkyWatcherSpeedMode,
+) -> SkyWatcherMotionMode:
+    return SkyWatcherMotionMode(slew_mode=slew_mode, direction=direction, speed_mode=speed_mode)
+
+
+_is_running: Callable[[SkyWatcherStatus], bool] = operator.attrgetter("running")
+
+
+def _is_stopped(status: SkyWatcherStatus) -> bool:
+    return not status.running
+
+
+@functools.lru_cache(maxsize=None)
+def _has_direction(direction: SkyWatcherDirection) -> Callable[[SkyWatcherStatus], bool]:
+    def predicate(status: SkyWatcherStatus) -> bool:
+        return status.direction is direction
+
+    return predicate
+
+
+def _next_sample(
+    mc: SkyWatcherMC,
+    axis: SkyWatcherAxis,
+    after_ns: int,
+    deadline_ns: int,
+) -> Optional[SkyWatcherStateSample]:
+    remaining_ns = max(0, deadline_ns - time.monotonic_ns())
+    return mc.wait_state(axis, newer_than_ns=after_ns, timeout_s=remaining_ns / NS_PER_S)
+
+
 def _wait_for_status(
     mc: SkyWatcherMC,
     axis: SkyWatcherAxis,
     predicate: Callable[[SkyWatcherStatus], bool],
     *,
     timeout_s: float,
-    poll_interval_s: float,
     note: str,
 ) -> SkyWatcherStatus:
-    start = time.monotonic()
+    log_samples = LOGGER.isEnabledFor(logging.DEBUG)
+    axis_name = axis.name
+    start_ns = time.monotonic_ns()
+    deadline_ns = start_ns + int(timeout_s * NS_PER_S)
+    sample_ns = start_ns
     LOGGER.info("WAIT %s timeout_s=%s", note, timeout_s)
-    while True:
-        status = mc.inquire_status(axis)
-        LOGGER.info(
-            "WAIT FOR STATUS %s raw=%s running=%s initialized=%s mode=%s dir=%s speed=%s note=%s",
-            axis.name,
-            status.raw,
-            status.running,
-            status.initialized,
-            status.slew_mode.name,
-            status.direction.name,
-            status.speed_mode.name,
-            note,
-        )
-        _log_position(axis, mc.inquire_position(axis), note)
-        if predicate(status):
-            return status
-        elapsed = time.monotonic() - start
-        if elapsed >= timeout_s:
-            LOGGER.warning(
-                "WAIT FAILED %s elapsed_s=%s timeout_s=%s",
-                note,
-                elapsed,
-                timeout_s,
-            )
-            pytest.fail(note)
-        time.sleep(poll_interval_s)
+    while (sample := _next_sample(mc, axis, sample_ns, deadline_ns)) is not None:
+        sample_ns = sample.monotonic_ns
+        if log_samples:
+            _log_status_sample(axis_name, sample.status, sample.position, note)
+        if predicate(sample.status):
+            return sample.status
+    LOGGER.warning(
+        "WAIT FAILED %s elapsed_s=%s timeout_s=%s",
+        note,
+        (time.monotonic_ns() - start_ns) / NS_PER_S,
+        timeout_s,
+    )
+    pytest.fail(note)
+
+
+def _wait_idle(mc: SkyWatcherMC, axis: SkyWatcherAxis, *, timeout_s: float) -> None:
+    sample_ns = time.monotonic_ns()
+    deadline_ns = sample_ns + int(timeout_s * NS_PER_S)
+    while (sample := _next_sample(mc, axis, sample_ns, deadline_ns)) is not None:
+        if not sample.status.running:
+            return
+        sample_ns = sample.monotonic_ns
+    LOGGER.warning("WAIT IDLE %s still running after timeout_s=%s", axis.name, timeout_s)
 
 
 def _wait_for_position_change(
     mc: SkyWatcherMC,
     axis: SkyWatcherAxis,
-    start_pos: int,
+    start_pos: Optional[int] = None,
     *,
     min_delta: int,
     timeout_s: float,
-    poll_interval_s: float,
     note: str,
 ) -> int:
-    start = time.monotonic()
+    if start_pos is None:
+        # Reuse the poller's latest sample instead of spending a round trip on the baseline.
+        latest = mc.latest(axis)
+        start_pos = mc.inquire_position(axis) if latest is None else latest.position
+    log_samples = LOGGER.isEnabledFor(logging.DEBUG)
+    axis_name = axis.name
+    start_ns = time.monotonic_ns()
+    deadline_ns = start_ns + int(timeout_s * NS_PER_S)
+    sample_ns = start_ns
+    pos = start_pos
     LOGGER.info(
         "WAIT %s timeout_s=%s start_pos=%s",
         note,
         timeout_s,
         start_pos,
     )
-    while True:
-        pos = mc.inquire_position(axis)
-        _log_position(axis, pos, note)
+    while (sample := _next_sample(mc, axis, sample_ns, deadline_ns)) is not None:
+        sample_ns = sample.monotonic_ns
+        pos = sample.position
+        if log_samples:
+            _log_position_sample(axis_name, pos, note)
         if _tick_delta(pos, start_pos) >= min_delta:
             return pos
-        elapsed = time.monotonic() - start
-        if elapsed >= timeout_s:
-            LOGGER.info(
-                "WAIT %s elapsed_s=%s timeout_s=%s pos=%s",
-                note,
-                elapsed,
-                timeout_s,
-                pos,
-            )
-            pytest.fail(note)
-        time.sleep(poll_interval_s)
+    LOGGER.info(
+        "WAIT %s elapsed_s=%s timeout_s=%s pos=%s",
+        note,
+        (time.monotonic_ns() - start_ns) / NS_PER_S,
+        timeout_s,
+        pos,
+    )
+    pytest.fail(note)
 
 
 def _assert_position_stable(
@@ -173,30 +266,103 @@ def _assert_position_stable(
     axis: SkyWatcherAxis,
     *,
     duration_s: float,
-    poll_interval_s: float,
     max_delta: int,
     note: str,
 ) -> int:
-    start = time.monotonic()
+    log_samples = LOGGER.isEnabledFor(logging.DEBUG)
+    axis_name = axis.name
+    sample_ns = time.monotonic_ns()
+    deadline_ns = sample_ns + int(duration_s * NS_PER_S)
     start_pos = mc.inquire_position(axis)
     _log_position(axis, start_pos, note)
-    while True:
-        elapsed = time.monotonic() - start
-        if elapsed >= duration_s:
-            return start_pos
-        time.sleep(poll_interval_s)
-        pos = mc.inquire_position(axis)
-        _log_position(axis, pos, note)
+    while (sample := _next_sample(mc, axis, sample_ns, deadline_ns)) is not None:
+        sample_ns = sample.monotonic_ns
+        pos = sample.position
         if (delta := _tick_delta(pos, start_pos)) > max_delta:
+            _log_position(axis, pos, note)
             pytest.fail(note)
-        else:
-            LOGGER.info(
-                "POSITION STABLE %s delta=%s max_delta=%s note=%s",
-                axis.name,
-                delta,
-                max_delta,
+        if log_samples:
+            _log_stable_sample(axis_name, pos, delta, max_delta, note)
+    return start_pos
+
+
+def _wait_stopped_and_stable(
+    mc: SkyWatcherMC,
+    axis: SkyWatcherAxis,
+    *,
+    stop_timeout_s: float,
+    settle_s: float,
+    max_delta: int,
+    note: str,
+) -> int:
+    log_samples = LOGGER.isEnabledFor(logging.DEBUG)
+    axis_name = axis.name
+    start_ns = time.monotonic_ns()
+    stop_deadline_ns = start_ns + int(stop_timeout_s * NS_PER_S)
+    sample_ns = start_ns
+    LOGGER.info("WAIT %s timeout_s=%s settle_s=%s", note, stop_timeout_s, settle_s)
+    stopped: Optional[SkyWatcherStateSample] = None
+    while stopped is None:
+        sample = _next_sample(mc, axis, sample_ns, stop_deadline_ns)
+        if sample is None:
+            LOGGER.warning(
+                "WAIT FAILED %s elapsed_s=%s timeout_s=%s",
                 note,
+                (time.monotonic_ns() - start_ns) / NS_PER_S,
+                stop_timeout_s,
             )
+            pytest.fail(note)
+        sample_ns = sample.monotonic_ns
+        if log_samples:
+            _log_status_sample(axis_name, sample.status, sample.position, note)
+        if not sample.status.running:
+            stopped = sample
+    start_pos = pos = stopped.position
+    settle_deadline_ns = sample_ns + int(settle_s * NS_PER_S)
+    while (sample := _next_sample(mc, axis, sample_ns, settle_deadline_ns)) is not None:
+        sample_ns = sample.monotonic_ns
+        pos = sample.position
+        if (delta := _tick_delta(pos, start_pos)) > max_delta:
+            _log_position(axis, pos, note)
+            pytest.fail(note)
+        if log_samples:
+            _log_stable_sample(axis_name, pos, delta, max_delta, note)
+    return pos
+
+
+class _StatusFormat:
+    """Formats a status only when the log record is actually emitted."""
+
+    __slots__ = ("_status",)
+
+    def __init__(self, status: SkyWatcherStatus) -> None:
+        self._status = status
+
+    def __str__(self) -> str:
+        status = self._status
+        return (
+            f"raw={status.raw} running={status.running} initialized={status.initialized} "
+            f"mode={status.slew_mode.name} dir={status.direction.name} speed={status.speed_mode.name}"
+        )
+
+
+def _log_status_sample(axis_name: str, status: SkyWatcherStatus, pos: int, note: str) -> None:
+    LOGGER.debug("WAIT FOR STATUS %s %s pos=%s note=%s", axis_name, _StatusFormat(status), pos, note)
+
+
+def _log_position_sample(axis_name: str, pos: int, note: str) -> None:
+    LOGGER.debug("CHECK POSITION %s pos=%s note=%s", axis_name, pos, note)
+
+
+def _log_stable_sample(axis_name: str, pos: int, delta: int, max_delta: int, note: str) -> None:
+    LOGGER.debug(
+        "POSITION STABLE %s pos=%s delta=%s max_delta=%s note=%s",
+        axis_name,
+        pos,
+        delta,
+        max_delta,
+        note,
+    )
 
 
 def _log_position(axis: SkyWatcherAxis, pos: int, note: str) -> None:
@@ -208,10 +374,19 @@ def _log_position(axis: SkyWatcherAxis, pos: int, note: str) -> None:
     )
 
 
+def _serial_timeout_s(cfg: SkyWatcherTestConfig) -> float:
+    # Longest pipelined exchange: every frame's request and reply on the wire, plus device latency.
+    wire_bytes = SERIAL_MAX_PIPELINED_FRAMES * (SERIAL_MAX_REQUEST_BYTES + SERIAL_MAX_REPLY_BYTES)
+    wire_s = wire_bytes * SERIAL_BITS_PER_BYTE / cfg.baud
+    floor_s = SERIAL_TIMEOUT_MIN_S + wire_s * SERIAL_TIMEOUT_WIRE_MARGIN
+    return min(cfg.timeout_s, max(floor_s, cfg.poll_interval_s / SERIAL_TIMEOUT_POLL_DIVISOR))
+
+
 def _safe_stop(mc: SkyWatcherMC, axis: SkyWatcherAxis) -> None:
     LOGGER.info("STEP stop_motion axis=%s", axis.name)
     try:
         mc.stop_motion(axis)
+        return
     except Exception:
         LOGGER.exception("ACTION stop_motion_failed")
     try:
@@ -220,8 +395,17 @@ def _safe_stop(mc: SkyWatcherMC, axis: SkyWatcherAxis) -> None:
         LOGGER.exception("ACTION instant_stop_failed")
 
 
+@pytest.fixture(scope="session", params=SKYWATCHER_AXIS_CHANNELS)
+def skywatcher_axis(request: pytest.FixtureRequest) -> SkyWatcherAxis:
+    try:
+        return SkyWatcherAxis.from_channel(request.param)
+    except ValueError as exc:
+        LOGGER.info("SKIP %s", exc)
+        pytest.skip(str(exc))
+
+
 @pytest.fixture(scope="session")
-def skywatcher_config() -> SkyWatcherTestConfig:
+def skywatcher_config(skywatcher_axis: SkyWatcherAxis) -> SkyWatcherTestConfig:
     port = os.environ.get("SKYWATCHER_PORT", "/dev/tty.PL2303G-USBtoUART2120")
     if not port:
         LOGGER.info(
@@ -230,13 +414,11 @@ def skywatcher_config() -> SkyWatcherTestConfig:
         pytest.skip("SKYWATCHER_PORT is not set; skipping serial tests.")
     baud = int(os.environ.get("SKYWATCHER_BAUD", "115200"))
     timeout_s = float(os.environ.get("SKYWATCHER_TIMEOUT_S", "0.5"))
-    axis_value = os.environ.get("SKYWATCHER_AXIS", "1")
-    axis = SkyWatcherAxis.from_channel(axis_value)
     return SkyWatcherTestConfig(
         port=port,
         baud=baud,
         timeout_s=timeout_s,
-        axis=axis,
+        axis=skywatcher_axis,
         poll_interval_s=0.2,
         running_timeout_s=6.0,
         goto_timeout_s=20.0,
@@ -247,7 +429,7 @@ def skywatcher_config() -> SkyWatcherTestConfig:
 
 
 @pytest.fixture(scope="session")
-def skywatcher_mc(skywatcher_config: SkyWatcherTestConfig) -> SkyWatcherMC:
+def skywatcher_mc(skywatcher_config: SkyWatcherTestConfig) -> Iterator[SkyWatcherMC]:
     LOGGER.info(
         "STEP connect axis=%s port=%s",
         skywatcher_config.axis.name,
@@ -266,38 +448,79 @@ def skywatcher_mc(skywatcher_config: SkyWatcherTestConfig) -> SkyWatcherMC:
         )
         pytest.skip("pyserial is not available; skipping serial tests.")
     mc = SkyWatcherMC(dev, logger=logging.getLogger("tests.skywatcher.serial.mc"))
-    mc.do_initialize(
-        skywatcher_config.axis,
-        timeout_s=skywatcher_config.running_timeout_s,
-        poll_interval_s=skywatcher_config.poll_interval_s,
-    )
-    return mc
+    try:
+        mc.do_initialize(
+            skywatcher_config.axis,
+            timeout_s=skywatcher_config.running_timeout_s,
+            poll_interval_s=skywatcher_config.poll_interval_s,
+        )
+        dev.set_timeout(_serial_timeout_s(skywatcher_config))
+        mc.start_poller(skywatcher_config.axis, STATE_POLL_INTERVAL_S)
+        yield mc
+    finally:
+        mc.stop_poller()
+        dev.close()
 
 
-def test_connect_and_status(skywatcher_mc: SkyWatcherMC, skywatcher_config: SkyWatcherTestConfig) -> None:
+@pytest.fixture(scope="session")
+def skywatcher_params(
+    skywatcher_mc: SkyWatcherMC,
+    skywatcher_config: SkyWatcherTestConfig,
+) -> SkyWatcherTestParams:
     axis = skywatcher_config.axis
-    LOGGER.info("STEP read_status axis=%s", axis.name)
     cpr = skywatcher_mc.inquire_cpr(axis)
     timer_freq = skywatcher_mc.inquire_timer_freq(axis)
-    status = skywatcher_mc.inquire_status(axis)
     LOGGER.info(
         "ACTION axis=%s cpr=%s timer_freq=%s",
         axis.name,
         cpr,
         timer_freq,
     )
-    LOGGER.info(
-        "STATUS %s raw=%s running=%s initialized=%s mode=%s dir=%s speed=%s note=read_status",
-        axis.name,
-        status.raw,
-        status.running,
-        status.initialized,
-        status.slew_mode.name,
-        status.direction.name,
-        status.speed_mode.name,
+    return SkyWatcherTestParams(
+        cpr=cpr,
+        timer_freq=timer_freq,
+        goto_delta=_compute_goto_delta(cpr),
+        step_period_manual=_compute_step_period(cpr, timer_freq, skywatcher_config.manual_rate_deg_s),
+        step_period_sidereal=_compute_step_period(cpr, timer_freq, SIDEREAL_RATE_DEG_S),
+        slew_tick_delta=_compute_slew_tick_delta(
+            cpr,
+            skywatcher_config.manual_rate_deg_s,
+            skywatcher_config.slew_duration_s,
+        ),
+        fwd_lowspeed_goto_mode=_motion_mode(
+            SkyWatcherSlewMode.GOTO,
+            SkyWatcherDirection.FORWARD,
+            SkyWatcherSpeedMode.LOWSPEED,
+        ),
+        bwd_lowspeed_goto_mode=_motion_mode(
+            SkyWatcherSlewMode.GOTO,
+            SkyWatcherDirection.BACKWARD,
+            SkyWatcherSpeedMode.LOWSPEED,
+        ),
+        fwd_lowspeed_slew_mode=_motion_mode(
+            SkyWatcherSlewMode.SLEW,
+            SkyWatcherDirection.FORWARD,
+            SkyWatcherSpeedMode.LOWSPEED,
+        ),
+        bwd_lowspeed_slew_mode=_motion_mode(
+            SkyWatcherSlewMode.SLEW,
+            SkyWatcherDirection.BACKWARD,
+            SkyWatcherSpeedMode.LOWSPEED,
+        ),
     )
-    assert cpr >= 1
-    assert timer_freq >= 1
+
+
+def test_connect_and_status(
+    skywatcher_mc: SkyWatcherMC,
+    skywatcher_config: SkyWatcherTestConfig,
+    skywatcher_params: SkyWatcherTestParams,
+) -> None:
+    axis = skywatcher_config.axis
+    LOGGER.info("STEP read_status axis=%s", axis.name)
+    status = skywatcher_mc.inquire_status(axis)
+    LOGGER.info("STATUS %s %s note=read_status", axis.name, _StatusFormat(status))
+    assert skywatcher_params.cpr >= 1
+    assert skywatcher_params.timer_freq >= 1
     assert isinstance(status, SkyWatcherStatus)
 
 
@@ -306,354 +529,184 @@ def test_check_position(skywatcher_mc: SkyWatcherMC, skywatcher_config: SkyWatch
     LOGGER.info("STEP read_position axis=%s", axis.name)
     pos = skywatcher_mc.inquire_position(axis)
     _log_position(axis, pos, "read_position")
-    assert 0 <= pos <= 0xFFFFFF
+    assert 0 <= pos <= TICK_MASK
 
 
-def test_enable_target_mode_and_update_pos(
-    skywatcher_mc: SkyWatcherMC,
-    skywatcher_config: SkyWatcherTestConfig,
+def _run_goto(
+    mc: SkyWatcherMC,
+    cfg: SkyWatcherTestConfig,
+    params: SkyWatcherTestParams,
+    *,
+    direction: SkyWatcherDirection,
+    wait_stopped: bool,
+    verify_target: bool,
+    verify_direction: bool,
 ) -> None:
-    axis = skywatcher_config.axis
-    start_pos = skywatcher_mc.inquire_position(axis)
-    _log_position(axis, start_pos, "check_position")
-    cpr = skywatcher_mc.inquire_cpr(axis)
-    delta = _compute_goto_delta(cpr)
-    target = _mask_ticks(start_pos + delta)
+    axis = cfg.axis
+    start_pos = mc.inquire_position(axis)
+    _log_position(axis, start_pos, "goto_start")
+    delta = params.goto_delta
+    if direction == SkyWatcherDirection.FORWARD:
+        mode = params.fwd_lowspeed_goto_mode
+        target = _mask_ticks(start_pos + delta)
+    else:
+        mode = params.bwd_lowspeed_goto_mode
+        target = _mask_ticks(start_pos - delta)
     LOGGER.info(
-        "STEP set_goto_mode axis=%s target=%s delta=%s",
+        "STEP start_goto axis=%s direction=%s target=%s delta=%s",
         axis.name,
+        direction.name,
         target,
         delta,
     )
     try:
-        skywatcher_mc.instant_stop(axis)
-        time.sleep(skywatcher_config.settle_delay_s)
-        mode = SkyWatcherMotionMode(
-            slew_mode=SkyWatcherSlewMode.GOTO,
-            direction=SkyWatcherDirection.FORWARD,
-            speed_mode=SkyWatcherSpeedMode.LOWSPEED,
+        mc.instant_stop(axis)
+        _wait_idle(mc, axis, timeout_s=cfg.settle_delay_s)
+        mc.configure_and_start_goto(
+            axis,
+            mode,
+            delta,
+            step_period=GOTO_LOW_PERIOD,
+            break_increment=min(GOTO_BREAK_MAX, delta),
         )
-        skywatcher_mc.set_motion_mode(axis, mode)
-        skywatcher_mc.set_step_period(axis, GOTO_LOW_PERIOD)
-        skywatcher_mc.set_target_breaks(axis, min(GOTO_BREAK_MAX, delta))
-        skywatcher_mc.set_goto_target_increment(axis, delta)
-        skywatcher_mc.set_motion_mode(axis, mode)
-        skywatcher_mc.start_motion(axis)
         _wait_for_status(
-            skywatcher_mc,
+            mc,
             axis,
-            lambda s: s.running,
-            timeout_s=skywatcher_config.running_timeout_s,
-            poll_interval_s=skywatcher_config.poll_interval_s,
+            _is_running,
+            timeout_s=cfg.running_timeout_s,
             note="wait_running",
         )
+        if verify_direction:
+            _wait_for_status(
+                mc,
+                axis,
+                _has_direction(direction),
+                timeout_s=cfg.running_timeout_s,
+                note="check_status",
+            )
         _wait_for_position_change(
-            skywatcher_mc,
+            mc,
             axis,
             start_pos,
             min_delta=1,
-            timeout_s=skywatcher_config.running_timeout_s,
-            poll_interval_s=skywatcher_config.poll_interval_s,
+            timeout_s=cfg.running_timeout_s,
             note="check_position",
         )
-        _wait_for_status(
-            skywatcher_mc,
-            axis,
-            lambda s: not s.running,
-            timeout_s=skywatcher_config.goto_timeout_s,
-            poll_interval_s=skywatcher_config.poll_interval_s,
-            note="wait_stopped",
-        )
-        _assert_position_stable(
-            skywatcher_mc,
+        if not wait_stopped:
+            return
+        end_pos = _wait_stopped_and_stable(
+            mc,
             axis,
-            duration_s=skywatcher_config.settle_delay_s,
-            poll_interval_s=skywatcher_config.poll_interval_s,
+            stop_timeout_s=cfg.goto_timeout_s,
+            settle_s=cfg.settle_delay_s,
             max_delta=100,
-            note="stop_stable",
-        )
-    finally:
-        _safe_stop(skywatcher_mc, axis)
-
-
-def test_do_goto_check_happens(skywatcher_mc: SkyWatcherMC, skywatcher_config: SkyWatcherTestConfig) -> None:
-    axis = skywatcher_config.axis
-    start_pos = skywatcher_mc.inquire_position(axis)
-    _log_position(axis, start_pos, "check_position")
-    cpr = skywatcher_mc.inquire_cpr(axis)
-    delta = _compute_goto_delta(cpr)
-    target = _mask_ticks(start_pos + delta)
-    LOGGER.info(
-        "STEP start_goto axis=%s target=%s delta=%s",
-        axis.name,
-        target,
-        delta,
-    )
-    try:
-        skywatcher_mc.instant_stop(axis)
-        time.sleep(skywatcher_config.settle_delay_s)
-        mode = SkyWatcherMotionMode(
-            slew_mode=SkyWatcherSlewMode.GOTO,
-            direction=SkyWatcherDirection.FORWARD,
-            speed_mode=SkyWatcherSpeedMode.LOWSPEED,
-        )
-        skywatcher_mc.set_motion_mode(axis, mode)
-        skywatcher_mc.set_step_period(axis, GOTO_LOW_PERIOD)
-        skywatcher_mc.set_target_breaks(axis, min(GOTO_BREAK_MAX, delta))
-        skywatcher_mc.set_goto_target_increment(axis, delta)
-        skywatcher_mc.set_motion_mode(axis, mode)
-        skywatcher_mc.start_motion(axis)
-        _wait_for_status(
-            skywatcher_mc,
-            axis,
-            lambda s: s.running,
-            timeout_s=skywatcher_config.running_timeout_s,
-            poll_interval_s=skywatcher_config.poll_interval_s,
-            note="wait_running",
-        )
-        _wait_for_position_change(
-            skywatcher_mc,
-            axis,
-            start_pos,
-            min_delta=1,
-            timeout_s=skywatcher_config.running_timeout_s,
-            poll_interval_s=skywatcher_config.poll_interval_s,
-            note="check_position",
+            note="wait_stopped",
         )
+        _log_position(axis, end_pos, "goto_end")
+        if verify_target:
+            tolerance = max(1, delta // 10)
+            assert _tick_delta(end_pos, target) <= tolerance
     finally:
-        _safe_stop(skywatcher_mc, axis)
-
-
-def test_set_target_and_goto_reaches_target(
+        _safe_stop(mc, axis)
+
+
+@pytest.mark.parametrize(
+    ("direction", "wait_stopped", "verify_target", "verify_direction"),
+    [
+        (SkyWatcherDirection.FORWARD, True, False, False),
+        (SkyWatcherDirection.FORWARD, False, False, False),
+        (SkyWatcherDirection.FORWARD, True, True, False),
+        (SkyWatcherDirection.BACKWARD, True, False, True),
+    ],
+    ids=["update_pos", "check_happens", "reaches_target", "backwards"],
+)
+def test_goto(
     skywatcher_mc: SkyWatcherMC,
     skywatcher_config: SkyWatcherTestConfig,
+    skywatcher_params: SkyWatcherTestParams,
+    direction: SkyWatcherDirection,
+    wait_stopped: bool,
+    verify_target: bool,
+    verify_direction: bool,
 ) -> None:
-    axis = skywatcher_config.axis
-    start_pos = skywatcher_mc.inquire_position(axis)
-    _log_position(axis, start_pos, "goto_start")
-    cpr = skywatcher_mc.inquire_cpr(axis)
-    delta = _compute_goto_delta(cpr)
-    target = _mask_ticks(start_pos + delta)
-    LOGGER.info(
-        "STEP goto_target axis=%s target=%s delta=%s",
-        axis.name,
-        target,
-        delta,
+    _run_goto(
+        skywatcher_mc,
+        skywatcher_config,
+        skywatcher_params,
+        direction=direction,
+        wait_stopped=wait_stopped,
+        verify_target=verify_target,
+        verify_direction=verify_direction,
     )
-    try:
-        skywatcher_mc.instant_stop(axis)
-        time.sleep(skywatcher_config.settle_delay_s)
-        mode = SkyWatcherMotionMode(
-            slew_mode=SkyWatcherSlewMode.GOTO,
-            direction=SkyWatcherDirection.FORWARD,
-            speed_mode=SkyWatcherSpeedMode.LOWSPEED,
-        )
-        skywatcher_mc.set_motion_mode(axis, mode)
-        skywatcher_mc.set_step_period(axis, GOTO_LOW_PERIOD)
-        skywatcher_mc.set_target_breaks(axis, min(GOTO_BREAK_MAX, delta))
-        skywatcher_mc.set_goto_target_increment(axis, delta)
-        skywatcher_mc.set_motion_mode(axis, mode)
-        skywatcher_mc.start_motion(axis)
-        _wait_for_status(
-            skywatcher_mc,
-            axis,
-            lambda s: s.running,
-            timeout_s=skywatcher_config.running_timeout_s,
-            poll_interval_s=skywatcher_config.poll_interval_s,
-            note="wait_running",
-        )
-        _wait_for_position_change(
-            skywatcher_mc,
-            axis,
-            start_pos,
-            min_delta=1,
-            timeout_s=skywatcher_config.running_timeout_s,
-            poll_interval_s=skywatcher_config.poll_interval_s,
-            note="move_check",
-        )
-        _wait_for_status(
-            skywatcher_mc,
-            axis,
-            lambda s: not s.running,
-            timeout_s=skywatcher_config.goto_timeout_s,
-            poll_interval_s=skywatcher_config.poll_interval_s,
-            note="wait_stopped",
-        )
-        end_pos = skywatcher_mc.inquire_position(axis)
-        _log_position(axis, end_pos, "goto_end")
-        tolerance = max(1, delta // 10)
-        assert _tick_delta(end_pos, target) <= tolerance
-        _assert_position_stable(
-            skywatcher_mc,
-            axis,
-            duration_s=skywatcher_config.settle_delay_s,
-            poll_interval_s=skywatcher_config.poll_interval_s,
-            max_delta=100,
-            note="stop_stable",
-        )
-    finally:
-        _safe_stop(skywatcher_mc, axis)
 
 
-def test_do_goto_backwards_check_statuses(
+def test_move_left_right_ra(
     skywatcher_mc: SkyWatcherMC,
     skywatcher_config: SkyWatcherTestConfig,
+    skywatcher_params: SkyWatcherTestParams,
 ) -> None:
     axis = skywatcher_config.axis
-    start_pos = skywatcher_mc.inquire_position(axis)
-    _log_position(axis, start_pos, "check_position")
-    cpr = skywatcher_mc.inquire_cpr(axis)
-    delta = _compute_goto_delta(cpr)
-    target = _mask_ticks(start_pos - delta)
-    LOGGER.info(
-        "STEP start_goto axis=%s target=%s delta=%s",
-        axis.name,
-        target,
-        delta,
-    )
-    try:
-        skywatcher_mc.instant_stop(axis)
-        time.sleep(skywatcher_config.settle_delay_s)
-        mode = SkyWatcherMotionMode(
-            slew_mode=SkyWatcherSlewMode.GOTO,
-            direction=SkyWatcherDirection.BACKWARD,
-            speed_mode=SkyWatcherSpeedMode.LOWSPEED,
-        )
-        skywatcher_mc.set_motion_mode(axis, mode)
-        skywatcher_mc.set_step_period(axis, GOTO_LOW_PERIOD)
-        skywatcher_mc.set_target_breaks(axis, min(GOTO_BREAK_MAX, delta))
-        skywatcher_mc.set_goto_target_increment(axis, delta)
-        skywatcher_mc.set_motion_mode(axis, mode)
-        skywatcher_mc.start_motion(axis)
-        _wait_for_status(
-            skywatcher_mc,
-            axis,
-            lambda s: s.running,
-            timeout_s=skywatcher_config.running_timeout_s,
-            poll_interval_s=skywatcher_config.poll_interval_s,
-            note="wait_running",
-        )
-        _wait_for_status(
-            skywatcher_mc,
-            axis,
-            lambda s: s.direction == SkyWatcherDirection.BACKWARD,
-            timeout_s=skywatcher_config.running_timeout_s,
-            poll_interval_s=skywatcher_config.poll_interval_s,
-            note="check_status",
-        )
-        _wait_for_position_change(
-            skywatcher_mc,
-            axis,
-            start_pos,
-            min_delta=1,
-            timeout_s=skywatcher_config.running_timeout_s,
-            poll_interval_s=skywatcher_config.poll_interval_s,
-            note="check_position",
-        )
-        _wait_for_status(
-            skywatcher_mc,
-            axis,
-            lambda s: not s.running,
-            timeout_s=skywatcher_config.goto_timeout_s,
-            poll_interval_s=skywatcher_config.poll_interval_s,
-            note="wait_stopped",
-        )
-        _assert_position_stable(
-            skywatcher_mc,
-            axis,
-            duration_s=skywatcher_config.settle_delay_s,
-            poll_interval_s=skywatcher_config.poll_interval_s,
-            max_delta=100,
-            note="stop_stable",
-        )
-    finally:
-        _safe_stop(skywatcher_mc, axis)
-
-
-def test_move_left_right_ra(skywatcher_mc: SkyWatcherMC, skywatcher_config: SkyWatcherTestConfig) -> None:
-    axis = skywatcher_config.axis
-    cpr = skywatcher_mc.inquire_cpr(axis)
-    timer_freq = skywatcher_mc.inquire_timer_freq(axis)
-    LOGGER.info(
-        "ACTION axis=%s cpr=%s timer_freq=%s",
-        axis.name,
-        cpr,
-        timer_freq,
-    )
-    step_period = _compute_step_period(cpr, timer_freq, skywatcher_config.manual_rate_deg_s)
-    for direction in (SkyWatcherDirection.FORWARD, SkyWatcherDirection.BACKWARD):
+    step_period = skywatcher_params.step_period_manual
+    for mode in (skywatcher_params.fwd_lowspeed_slew_mode, skywatcher_params.bwd_lowspeed_slew_mode):
         LOGGER.info(
             "STEP start_slew axis=%s direction=%s",
             axis.name,
-            direction.name,
+            mode.direction.name,
         )
         try:
             skywatcher_mc.instant_stop(axis)
-            time.sleep(skywatcher_config.settle_delay_s)
-            mode = SkyWatcherMotionMode(
-                slew_mode=SkyWatcherSlewMode.SLEW,
-                direction=direction,
-                speed_mode=SkyWatcherSpeedMode.LOWSPEED,
-            )
+            _wait_idle(skywatcher_mc, axis, timeout_s=skywatcher_config.settle_delay_s)
             skywatcher_mc.set_motion_mode(axis, mode)
             skywatcher_mc.set_step_period(axis, step_period)
             skywatcher_mc.start_motion(axis)
             _wait_for_status(
                 skywatcher_mc,
                 axis,
-                lambda s: s.running,
+                _is_running,
                 timeout_s=skywatcher_config.running_timeout_s,
-                poll_interval_s=skywatcher_config.poll_interval_s,
                 note="wait_running",
             )
-            _wait_for_position_change(
+            moved_pos = _wait_for_position_change(
                 skywatcher_mc,
                 axis,
-                skywatcher_mc.inquire_position(axis),
                 min_delta=1,
                 timeout_s=skywatcher_config.running_timeout_s,
-                poll_interval_s=skywatcher_config.poll_interval_s,
                 note="move_check",
             )
-            time.sleep(skywatcher_config.slew_duration_s)
+            _wait_for_position_change(
+                skywatcher_mc,
+                axis,
+                moved_pos,
+                min_delta=skywatcher_params.slew_tick_delta,
+                timeout_s=skywatcher_config.slew_duration_s * SLEW_TIMEOUT_FACTOR,
+                note="slew_moved",
+            )
         finally:
             _safe_stop(skywatcher_mc, axis)
-        _wait_for_status(
+        _wait_stopped_and_stable(
             skywatcher_mc,
             axis,
-            lambda s: not s.running,
-            timeout_s=skywatcher_config.running_timeout_s,
-            poll_interval_s=skywatcher_config.poll_interval_s,
-            note="wait_stopped",
-        )
-        _assert_position_stable(
-            skywatcher_mc,
-            axis,
-            duration_s=skywatcher_config.settle_delay_s,
-            poll_interval_s=skywatcher_config.poll_interval_s,
+            stop_timeout_s=skywatcher_config.running_timeout_s,
+            settle_s=skywatcher_config.settle_delay_s,
             max_delta=100,
-            note="stop_stable",
+            note="wait_stopped",
         )
 
 
-def test_enable_modes_and_check_it(skywatcher_mc: SkyWatcherMC, skywatcher_config: SkyWatcherTestConfig) -> None:
+def test_enable_modes_and_check_it(
+    skywatcher_mc: SkyWatcherMC,
+    skywatcher_config: SkyWatcherTestConfig,
+    skywatcher_params: SkyWatcherTestParams,
+) -> None:
     axis = skywatcher_config.axis
     cases = [
-        SkyWatcherMotionMode(
-            slew_mode=SkyWatcherSlewMode.SLEW,
-            direction=SkyWatcherDirection.FORWARD,
-            speed_mode=SkyWatcherSpeedMode.LOWSPEED,
-        ),
-        SkyWatcherMotionMode(
-            slew_mode=SkyWatcherSlewMode.SLEW,
-            direction=SkyWatcherDirection.BACKWARD,
-            speed_mode=SkyWatcherSpeedMode.HIGHSPEED,
-        ),
-        SkyWatcherMotionMode(
-            slew_mode=SkyWatcherSlewMode.GOTO,
-            direction=SkyWatcherDirection.FORWARD,
-            speed_mode=SkyWatcherSpeedMode.LOWSPEED,
+        skywatcher_params.fwd_lowspeed_slew_mode,
+        _motion_mode(
+            SkyWatcherSlewMode.SLEW,
+            SkyWatcherDirection.BACKWARD,
+            SkyWatcherSpeedMode.HIGHSPEED,
         ),
+        skywatcher_params.fwd_lowspeed_goto_mode,
     ]
     for mode in cases:
         LOGGER.info(
@@ -665,7 +718,7 @@ def test_enable_modes_and_check_it(skywatcher_mc: SkyWatcherMC, skywatcher_confi
         )
         try:
             skywatcher_mc.instant_stop(axis)
-            time.sleep(skywatcher_config.settle_delay_s)
+            _wait_idle(skywatcher_mc, axis, timeout_s=skywatcher_config.settle_delay_s)
             skywatcher_mc.set_motion_mode(axis, mode)
             if mode.speed_mode == SkyWatcherSpeedMode.HIGHSPEED:
                 skywatcher_mc.set_step_period(axis, HIGH_SPEED_PERIOD)
@@ -673,22 +726,12 @@ def test_enable_modes_and_check_it(skywatcher_mc: SkyWatcherMC, skywatcher_confi
                 _wait_for_status(
                     skywatcher_mc,
                     axis,
-                    lambda s: s.running,
+                    _is_running,
                     timeout_s=skywatcher_config.running_timeout_s,
-                    poll_interval_s=skywatcher_config.poll_interval_s,
                     note="wait_running",
                 )
             status = skywatcher_mc.inquire_status(axis)
-            LOGGER.info(
-                "STATUS %s raw=%s running=%s initialized=%s mode=%s dir=%s speed=%s note=mode_check",
-                axis.name,
-                status.raw,
-                status.running,
-                status.initialized,
-                status.slew_mode.name,
-                status.direction.name,
-                status.speed_mode.name,
-            )
+            LOGGER.info("STATUS %s %s note=mode_check", axis.name, _StatusFormat(status))
             assert status.slew_mode == mode.slew_mode
             assert status.speed_mode == mode.speed_mode
         finally:
@@ -696,9 +739,11 @@ def test_enable_modes_and_check_it(skywatcher_mc: SkyWatcherMC, skywatcher_confi
 
 
 def test_set_ra_position(skywatcher_mc: SkyWatcherMC, skywatcher_config: SkyWatcherTestConfig) -> None:
-    axis = SkyWatcherAxis.RA
+    axis = skywatcher_config.axis
+    if axis is not SkyWatcherAxis.RA:
+        pytest.skip("set_ra_position only applies to the RA axis.")
     skywatcher_mc.instant_stop(axis)
-    time.sleep(skywatcher_config.settle_delay_s)
+    _wait_idle(skywatcher_mc, axis, timeout_s=skywatcher_config.settle_delay_s)
     start_pos = skywatcher_mc.inquire_position(axis)
     new_position = _mask_ticks(start_pos + 10000)
     _log_position(axis, start_pos, "set_ra_start")
@@ -710,7 +755,6 @@ def test_set_ra_position(skywatcher_mc: SkyWatcherMC, skywatcher_config: SkyWatc
         skywatcher_mc,
         axis,
         duration_s=skywatcher_config.settle_delay_s,
-        poll_interval_s=skywatcher_config.poll_interval_s,
         max_delta=100,
         note="set_ra_stable",
     )
@@ -719,11 +763,10 @@ def test_set_ra_position(skywatcher_mc: SkyWatcherMC, skywatcher_config: SkyWatc
 def test_sidereal_tracking_enable_disable(
     skywatcher_mc: SkyWatcherMC,
     skywatcher_config: SkyWatcherTestConfig,
+    skywatcher_params: SkyWatcherTestParams,
 ) -> None:
     axis = skywatcher_config.axis
-    cpr = skywatcher_mc.inquire_cpr(axis)
-    timer_freq = skywatcher_mc.inquire_timer_freq(axis)
-    step_period = _compute_step_period(cpr, timer_freq, SIDEREAL_RATE_DEG_S)
+    step_period = skywatcher_params.step_period_sidereal
     LOGGER.info(
         "STEP tracking_enable axis=%s step_period=%s",
         axis.name,
@@ -731,30 +774,22 @@ def test_sidereal_tracking_enable_disable(
     )
     try:
         skywatcher_mc.instant_stop(axis)
-        time.sleep(skywatcher_config.settle_delay_s)
-        mode = SkyWatcherMotionMode(
-            slew_mode=SkyWatcherSlewMode.SLEW,
-            direction=SkyWatcherDirection.FORWARD,
-            speed_mode=SkyWatcherSpeedMode.LOWSPEED,
-        )
-        skywatcher_mc.set_motion_mode(axis, mode)
+        _wait_idle(skywatcher_mc, axis, timeout_s=skywatcher_config.settle_delay_s)
+        skywatcher_mc.set_motion_mode(axis, skywatcher_params.fwd_lowspeed_slew_mode)
         skywatcher_mc.set_step_period(axis, step_period)
         skywatcher_mc.start_motion(axis)
         _wait_for_status(
             skywatcher_mc,
             axis,
-            lambda s: s.running,
+            _is_running,
             timeout_s=skywatcher_config.running_timeout_s,
-            poll_interval_s=skywatcher_config.poll_interval_s,
             note="tracking_running",
         )
         _wait_for_position_change(
             skywatcher_mc,
             axis,
-            skywatcher_mc.inquire_position(axis),
             min_delta=1,
             timeout_s=skywatcher_config.running_timeout_s,
-            poll_interval_s=skywatcher_config.poll_interval_s,
             note="tracking_move",
         )
         LOGGER.info("STEP tracking_disable axis=%s", axis.name)
@@ -762,16 +797,14 @@ def test_sidereal_tracking_enable_disable(
         _wait_for_status(
             skywatcher_mc,
             axis,
-            lambda s: not s.running,
+            _is_stopped,
             timeout_s=skywatcher_config.running_timeout_s,
-            poll_interval_s=skywatcher_config.poll_interval_s,
             note="tracking_stopped",
         )
         _assert_position_stable(
             skywatcher_mc,
             axis,
             duration_s=skywatcher_config.settle_delay_s,
-            poll_interval_s=skywatcher_config.poll_interval_s,
             max_delta=100,
             note="tracking_stop_stable",
         )
@@ -787,14 +820,13 @@ def test_set_ra_rate_does_not_start_motion(
     rate = SkyWatcherConstants.SIDEREAL_RATE_MULT
     try:
         skywatcher_mc.instant_stop(axis)
-        time.sleep(skywatcher_config.settle_delay_s)
+        _wait_idle(skywatcher_mc, axis, timeout_s=skywatcher_config.settle_delay_s)
         skywatcher_mc.set_ra_rate(rate, axis=axis)
         status = _wait_for_status(
             skywatcher_mc,
             axis,
-            lambda s: not s.running,
+            _is_stopped,
             timeout_s=skywatcher_config.running_timeout_s,
-            poll_interval_s=skywatcher_config.poll_interval_s,
             note="ra_rate_no_start",
         )
         assert status.slew_mode == SkyWatcherSlewMode.SLEW
@@ -812,39 +844,34 @@ def test_start_ra_tracking_start_stop(
     trackspeed = SkyWatcherConstants.SIDEREAL_SPEED_ARCSEC_S
     try:
         skywatcher_mc.instant_stop(axis)
-        time.sleep(skywatcher_config.settle_delay_s)
+        _wait_idle(skywatcher_mc, axis, timeout_s=skywatcher_config.settle_delay_s)
         skywatcher_mc.start_ra_tracking(trackspeed, axis=axis)
         _wait_for_status(
             skywatcher_mc,
             axis,
-            lambda s: s.running,
+            _is_running,
             timeout_s=skywatcher_config.running_timeout_s,
-            poll_interval_s=skywatcher_config.poll_interval_s,
             note="ra_tracking_running",
         )
         _wait_for_position_change(
             skywatcher_mc,
             axis,
-            skywatcher_mc.inquire_position(axis),
             min_delta=TRACKING_MIN_TICK_DELTA,
             timeout_s=skywatcher_config.running_timeout_s,
-            poll_interval_s=skywatcher_config.poll_interval_s,
             note="ra_tracking_move",
         )
         skywatcher_mc.start_ra_tracking(SkyWatcherConstants.ZERO_RATE, axis=axis)
         _wait_for_status(
             skywatcher_mc,
             axis,
-            lambda s: not s.running,
+            _is_stopped,
             timeout_s=skywatcher_config.running_timeout_s,
-            poll_interval_s=skywatcher_config.poll_interval_s,
             note="ra_tracking_stopped",
         )
         _assert_position_stable(
             skywatcher_mc,
             axis,
             duration_s=skywatcher_config.settle_delay_s,
-            poll_interval_s=skywatcher_config.poll_interval_s,
             max_delta=TRACKING_STOP_MAX_TICK_DELTA,
             note="ra_tracking_stop_stable",
         )